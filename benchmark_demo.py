@@ -6,8 +6,23 @@ This demo bypasses API key requirements to show how benchmarks work.
 """
 
 import asyncio
+import io
 import os
-from llmemory_meter import MemoryComparator, StandardBenchmarks
+import sys
+import traceback
+from contextlib import contextmanager, redirect_stdout
+from llmemory_meter import MemoryComparator, StandardBenchmarks, install_fast_loop, log_progress_to_stdout
+
+
+@contextmanager
+def buffered_output():
+    """Collect a report's print() output and emit it with a single write."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 async def main():
@@ -40,58 +55,59 @@ async def main():
     try:
         results = await comparator.run_benchmark_suite("Conversational AI Memory", tools)
         
-        print(f"\n📊 Benchmark Execution Results:")
-        print("-" * 40)
-        
-        # Show benchmark info
-        if "benchmark_info" in results:
-            info = results["benchmark_info"]
-            print(f"📝 Benchmark: {info['name']}")
-            print(f"📂 Category: {info['category']}")
-            print(f"🔢 Workloads: {info['num_workloads']}")
-            print(f"📊 Recommended Metrics: {', '.join(info['recommended_metrics'] or [])}")
-        
-        # Show workload results
-        if "standard_results" in results and "workload_results" in results["standard_results"]:
-            workload_results = results["standard_results"]["workload_results"]
-            print(f"\n📋 Workload Execution:")
-            print("-" * 30)
+        with buffered_output():
+            print(f"\n📊 Benchmark Execution Results:")
+            print("-" * 40)
             
-            for workload_name, comparison in workload_results.items():
-                print(f"\n📝 {workload_name}:")
-                for tool_name, result in comparison.items():
-                    print(f"  🔧 {tool_name}:")
-                    print(f"     ✅ Success Rate: {result.success_rate*100:.1f}%")
-                    print(f"     ⚡ Total Time: {result.total_latency_ms:.0f}ms")
-                    print(f"     📊 Steps: {len(result.step_results)}")
-                    
-                    # Show some step details
-                    if result.step_results:
-                        successful_steps = [s for s in result.step_results if s.success]
-                        failed_steps = [s for s in result.step_results if not s.success]
-                        print(f"     ✅ Successful: {len(successful_steps)}")
-                        if failed_steps:
-                            print(f"     ❌ Failed: {len(failed_steps)}")
-                            for step in failed_steps[:2]:  # Show first 2 failures
-                                print(f"        • Step {step.step_index}: {step.error_message}")
-        
-        # Show overall metrics if available
-        if "standard_results" in results and "overall_metrics" in results["standard_results"]:
-            metrics = results["standard_results"]["overall_metrics"]
-            if metrics:
-                print(f"\n📈 Overall Performance Metrics:")
-                print("-" * 35)
+            # Show benchmark info
+            if "benchmark_info" in results:
+                info = results["benchmark_info"]
+                print(f"📝 Benchmark: {info['name']}")
+                print(f"📂 Category: {info['category']}")
+                print(f"🔢 Workloads: {info['num_workloads']}")
+                print(f"📊 Recommended Metrics: {', '.join(info['recommended_metrics'] or [])}")
+            
+            # Show workload results
+            if "standard_results" in results and "workload_results" in results["standard_results"]:
+                workload_results = results["standard_results"]["workload_results"]
+                print(f"\n📋 Workload Execution:")
+                print("-" * 30)
                 
-                for tool_name, tool_metrics in metrics.items():
-                    print(f"\n🔧 {tool_name.upper()}:")
-                    print(f"  • Average Latency: {tool_metrics['avg_latency_ms']:.1f}ms")
-                    print(f"  • P95 Latency: {tool_metrics['p95_latency_ms']:.1f}ms")
-                    print(f"  • Success Rate: {tool_metrics['success_rate']:.1f}%")
-                    print(f"  • Total Queries: {tool_metrics['total_queries']}")
+                for workload_name, comparison in workload_results.items():
+                    print(f"\n📝 {workload_name}:")
+                    for tool_name, result in comparison.items():
+                        print(f"  🔧 {tool_name}:")
+                        print(f"     ✅ Success Rate: {result.success_rate*100:.1f}%")
+                        print(f"     ⚡ Total Time: {result.total_latency_ms:.0f}ms")
+                        print(f"     📊 Steps: {result.n_steps}")
+                        
+                        # Show some step details
+                        if result.n_steps:
+                            print(f"     ✅ Successful: {result.n_success}")
+                            if result.n_failed:
+                                print(f"     ❌ Failed: {result.n_failed}")
+                                for step_index in result.failed_indices[:2]:  # Show first 2 failures
+                                    print(f"        • Step {step_index}: {result.errors.get(step_index)}")
+            
+            # Show overall metrics if available
+            if "standard_results" in results and "overall_metrics" in results["standard_results"]:
+                metrics = results["standard_results"]["overall_metrics"]
+                if metrics:
+                    print(f"\n📈 Overall Performance Metrics:")
+                    print("-" * 35)
+                    
+                    for tool_name, tool_metrics in metrics.items():
+                        print(f"\n🔧 {tool_name.upper()}:")
+                        print(f"  • Average Latency: {tool_metrics['avg_latency_ms']:.1f}ms")
+                        print(f"  • P95 Latency: {tool_metrics['p95_latency_ms']:.1f}ms")
+                        print(f"  • Success Rate: {tool_metrics['success_rate']:.1f}%")
+                        print(f"  • Total Queries: {tool_metrics['total_queries']}")
         
+    except (ValueError, ImportError) as e:
+        # Configuration problems (unknown suite, missing key or SDK) need no stack trace
+        print(f"❌ Error running benchmark: {e}")
     except Exception as e:
         print(f"❌ Error running benchmark: {e}")
-        import traceback
         traceback.print_exc()
     
     # Show what a successful run would look like
@@ -137,4 +153,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
+    log_progress_to_stdout()
     asyncio.run(main())
@@ -10,7 +10,21 @@ Usage:
 """
 
 import asyncio
-from llmemory_meter import MemoryComparator, StandardBenchmarks
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+from llmemory_meter import MemoryComparator, StandardBenchmarks, install_fast_loop, log_progress_to_stdout
+
+
+@contextmanager
+def buffered_output():
+    """Collect a report's print() output and emit it with a single write."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 async def main():
@@ -45,25 +59,26 @@ async def main():
     try:
         results = await comparator.run_benchmark_suite("Conversational AI Memory", tools)
         
-        # Print results summary
-        print(f"\n📊 Results Summary:")
-        print("-" * 40)
-        
-        if "standard_results" in results and "overall_metrics" in results["standard_results"]:
-            metrics = results["standard_results"]["overall_metrics"]
-            for tool_name, tool_metrics in metrics.items():
-                print(f"\n🔧 {tool_name.upper()}:")
-                print(f"  • Avg Latency: {tool_metrics['avg_latency_ms']:.1f}ms")
-                print(f"  • Success Rate: {tool_metrics['success_rate']:.1f}%")
-                print(f"  • Total Queries: {tool_metrics['total_queries']}")
-        
-        # Show benchmark-specific info
-        if "benchmark_info" in results:
-            benchmark_info = results["benchmark_info"]
-            print(f"\n📝 Benchmark Details:")
-            print(f"  • Category: {benchmark_info['category']}")
-            print(f"  • Reference: {benchmark_info['reference']}")
-            print(f"  • Recommended Metrics: {', '.join(benchmark_info['recommended_metrics'] or [])}")
+        with buffered_output():
+            # Print results summary
+            print(f"\n📊 Results Summary:")
+            print("-" * 40)
+            
+            if "standard_results" in results and "overall_metrics" in results["standard_results"]:
+                metrics = results["standard_results"]["overall_metrics"]
+                for tool_name, tool_metrics in metrics.items():
+                    print(f"\n🔧 {tool_name.upper()}:")
+                    print(f"  • Avg Latency: {tool_metrics['avg_latency_ms']:.1f}ms")
+                    print(f"  • Success Rate: {tool_metrics['success_rate']:.1f}%")
+                    print(f"  • Total Queries: {tool_metrics['total_queries']}")
+            
+            # Show benchmark-specific info
+            if "benchmark_info" in results:
+                benchmark_info = results["benchmark_info"]
+                print(f"\n📝 Benchmark Details:")
+                print(f"  • Category: {benchmark_info['category']}")
+                print(f"  • Reference: {benchmark_info['reference']}")
+                print(f"  • Recommended Metrics: {', '.join(benchmark_info['recommended_metrics'] or [])}")
         
     except Exception as e:
         print(f"❌ Error running benchmark: {e}")
@@ -76,16 +91,17 @@ async def main():
     try:
         results = await comparator.run_benchmark_suite("Long Context Memory", tools)
         
-        # Print workload-specific results
-        if "standard_results" in results and "workload_results" in results["standard_results"]:
-            workload_results = results["standard_results"]["workload_results"]
-            print(f"\n📊 Workload Results:")
-            print("-" * 40)
-            
-            for workload_name, workload_comparison in workload_results.items():
-                print(f"\n📝 {workload_name}:")
-                for tool_name, result in workload_comparison.items():
-                    print(f"  🔧 {tool_name}: {result.success_rate*100:.1f}% success, {result.total_latency_ms:.0f}ms")
+        with buffered_output():
+            # Print workload-specific results
+            if "standard_results" in results and "workload_results" in results["standard_results"]:
+                workload_results = results["standard_results"]["workload_results"]
+                print(f"\n📊 Workload Results:")
+                print("-" * 40)
+                
+                for workload_name, workload_comparison in workload_results.items():
+                    print(f"\n📝 {workload_name}:")
+                    for tool_name, result in workload_comparison.items():
+                        print(f"  🔧 {tool_name}: {result.success_rate*100:.1f}% success, {result.total_latency_ms:.0f}ms")
         
     except Exception as e:
         print(f"❌ Error running benchmark: {e}")
@@ -98,26 +114,26 @@ async def main():
     try:
         results = await comparator.run_benchmark_suite("Technical Performance", tools)
         
-        # Show step-by-step results for stress test
-        if "standard_results" in results and "workload_results" in results["standard_results"]:
-            workload_results = results["standard_results"]["workload_results"]
-            
-            for workload_name, workload_comparison in workload_results.items():
-                if "Stress Test" in workload_name:
-                    print(f"\n📊 {workload_name} Results:")
-                    print("-" * 40)
-                    
-                    for tool_name, result in workload_comparison.items():
-                        print(f"\n🔧 {tool_name.upper()}:")
-                        print(f"  • Total Steps: {len(result.step_results)}")
-                        print(f"  • Success Rate: {result.success_rate*100:.1f}%")
-                        print(f"  • Avg Latency/Step: {result.avg_latency_ms:.1f}ms")
-                        print(f"  • P95 Latency: {result.p95_latency_ms:.1f}ms")
+        with buffered_output():
+            # Show step-by-step results for stress test
+            if "standard_results" in results and "workload_results" in results["standard_results"]:
+                workload_results = results["standard_results"]["workload_results"]
+                
+                for workload_name, workload_comparison in workload_results.items():
+                    if "Stress Test" in workload_name:
+                        print(f"\n📊 {workload_name} Results:")
+                        print("-" * 40)
                         
-                        # Show failed steps if any
-                        failed_steps = [r for r in result.step_results if not r.success]
-                        if failed_steps:
-                            print(f"  • Failed Steps: {len(failed_steps)}")
+                        for tool_name, result in workload_comparison.items():
+                            print(f"\n🔧 {tool_name.upper()}:")
+                            print(f"  • Total Steps: {result.n_steps}")
+                            print(f"  • Success Rate: {result.success_rate*100:.1f}%")
+                            print(f"  • Avg Latency/Step: {result.avg_latency_ms:.1f}ms")
+                            print(f"  • P95 Latency: {result.p95_latency_ms:.1f}ms")
+                            
+                            # Show failed steps if any
+                            if result.n_failed:
+                                print(f"  • Failed Steps: {result.n_failed}")
         
     except Exception as e:
         print(f"❌ Error running benchmark: {e}")
@@ -138,26 +154,29 @@ async def main():
         except Exception as e:
             print(f"❌ Error with {benchmark_name}: {e}")
     
-    # Summary comparison
-    print(f"\n📊 Multi-Benchmark Summary:")
-    print("-" * 40)
-    
-    for benchmark_name, results in comparison_results.items():
-        print(f"\n📝 {benchmark_name}:")
-        if "standard_results" in results and "overall_metrics" in results["standard_results"]:
-            metrics = results["standard_results"]["overall_metrics"]
-            for tool_name, tool_metrics in metrics.items():
-                print(f"  🔧 {tool_name}: {tool_metrics['avg_latency_ms']:.1f}ms avg, {tool_metrics['success_rate']:.1f}% success")
-    
-    print(f"\n" + "="*60)
-    print("✅ Benchmark Examples Complete!")
-    print("💡 Next Steps:")
-    print("  1. Set up real API keys in .env file")
-    print("  2. Replace mock implementations with actual API calls")
-    print("  3. Run benchmarks on production memory systems")
-    print("  4. Compare results across different tools")
-    print("="*60)
+    with buffered_output():
+        # Summary comparison
+        print(f"\n📊 Multi-Benchmark Summary:")
+        print("-" * 40)
+        
+        for benchmark_name, results in comparison_results.items():
+            print(f"\n📝 {benchmark_name}:")
+            if "standard_results" in results and "overall_metrics" in results["standard_results"]:
+                metrics = results["standard_results"]["overall_metrics"]
+                for tool_name, tool_metrics in metrics.items():
+                    print(f"  🔧 {tool_name}: {tool_metrics['avg_latency_ms']:.1f}ms avg, {tool_metrics['success_rate']:.1f}% success")
+        
+        print(f"\n" + "="*60)
+        print("✅ Benchmark Examples Complete!")
+        print("💡 Next Steps:")
+        print("  1. Set up real API keys in .env file")
+        print("  2. Replace mock implementations with actual API calls")
+        print("  3. Run benchmarks on production memory systems")
+        print("  4. Compare results across different tools")
+        print("="*60)
 
 
 if __name__ == "__main__":
+    install_fast_loop()
+    log_progress_to_stdout()
     asyncio.run(main())
@@ -17,7 +17,7 @@ import os
 # Add the parent directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from llmemory_meter import MemoryComparator
+from llmemory_meter import MemoryComparator, install_fast_loop, log_progress_to_stdout
 
 
 async def main():
@@ -108,4 +108,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
+    log_progress_to_stdout()
     asyncio.run(main())
@@ -17,7 +17,7 @@ import os
 # Add the parent directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from llmemory_meter import MemoryComparator
+from llmemory_meter import MemoryComparator, install_fast_loop, log_progress_to_stdout
 from llmemory_meter.workload import Workload, WorkloadStep
 
 
@@ -154,11 +154,10 @@ async def main():
                 print(f"  Avg Latency/Step: {result.avg_latency_ms:.0f}ms")
                 
                 # Show failed steps if any
-                failed_steps = [r for r in result.step_results if not r.success]
-                if failed_steps:
-                    print(f"  Failed Steps: {len(failed_steps)}")
-                    for step in failed_steps:
-                        print(f"    - Step {step.step_index}: {step.error_message}")
+                if result.n_failed:
+                    print(f"  Failed Steps: {result.n_failed}")
+                    for step_index in result.failed_indices:
+                        print(f"    - Step {step_index}: {result.errors.get(step_index)}")
         
         # Run comprehensive benchmark
         print(f"\n📊 Running comprehensive benchmark across all workloads...")
@@ -176,4 +175,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
+    log_progress_to_stdout()
     asyncio.run(main())
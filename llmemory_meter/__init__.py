@@ -5,13 +5,26 @@ A Python library for comparing different AI memory systems like Mem0,
 OpenAI Memory, MemGPT, and LangMem with custom workloads.
 """
 
+import asyncio
+import importlib
+import logging
+import sys
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
-from llmemory_meter.comparator import MemoryComparator
-from llmemory_meter.memory_tools import Mem0Tool, OpenAIMemoryTool
-from llmemory_meter.workload import Workload, WorkloadResult
-from llmemory_meter.benchmarks import StandardBenchmarks, BenchmarkSuite, BenchmarkRunner
+# Public names are imported on first access (PEP 562) so that importing the
+# package doesn't pull in every memory tool SDK up front.
+_LAZY_IMPORTS = {
+    "MemoryComparator": "llmemory_meter.comparator",
+    "Mem0Tool": "llmemory_meter.memory_tools",
+    "OpenAIMemoryTool": "llmemory_meter.memory_tools",
+    "Workload": "llmemory_meter.workload",
+    "WorkloadResult": "llmemory_meter.workload",
+    "StandardBenchmarks": "llmemory_meter.benchmarks",
+    "BenchmarkSuite": "llmemory_meter.benchmarks",
+    "BenchmarkRunner": "llmemory_meter.benchmarks",
+}
 
 __all__ = [
     "MemoryComparator",
@@ -21,5 +34,56 @@ __all__ = [
     "WorkloadResult",
     "StandardBenchmarks",
     "BenchmarkSuite", 
-    "BenchmarkRunner"
+    "BenchmarkRunner",
+    "install_fast_loop",
+    "log_progress_to_stdout"
 ]
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to whatever ``sys.stdout`` is at emit time, so redirect_stdout still captures it."""
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Progress messages go through the "llmemory_meter" logger. A library leaves handlers to the
+# application: scripts call log_progress_to_stdout(), or configure logging themselves.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def log_progress_to_stdout(level: int = logging.INFO):
+    """Print the library's progress messages to stdout, as the CLI and example scripts do."""
+    logger = logging.getLogger(__name__)
+    if not any(isinstance(handler, _StdoutHandler) for handler in logger.handlers):
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(level)
+
+
+def install_fast_loop() -> bool:
+    """Use uvloop for subsequent asyncio.run() calls if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,20 +5,55 @@ This module provides pre-configured benchmark workloads based on established
 datasets and evaluation frameworks for comprehensive memory system testing.
 """
 
-from typing import List, Dict, Any, Optional
+import copy
+import sys
+from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from llmemory_meter.workload import Workload, WorkloadStep
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkSuite:
-    """A collection of related benchmark workloads."""
+    """A collection of related benchmark workloads (immutable, cached per name)."""
     name: str
     description: str
-    category: str  # "conversational", "long_context", "technical", "domain_specific"
-    workloads: List[Workload]
+    category: str  # one of the CATEGORY_* constants
+    workloads: Tuple[Workload, ...]
     reference: Optional[str] = None  # Paper/dataset reference
-    metrics: Optional[List[str]] = None  # Recommended evaluation metrics
+    metrics: Optional[Tuple[str, ...]] = None  # Recommended evaluation metrics
+    
+    def __post_init__(self):
+        # Suites are cached and shared, so their collections are stored as tuples that callers can't mutate
+        object.__setattr__(self, "workloads", tuple(self.workloads))
+        if self.metrics is not None:
+            object.__setattr__(self, "metrics", tuple(self.metrics))
+
+
+# Suite categories, interned so lookups with names read from YAML hit by identity
+CATEGORY_CONVERSATIONAL = sys.intern("conversational")
+CATEGORY_LONG_CONTEXT = sys.intern("long_context")
+CATEGORY_TECHNICAL = sys.intern("technical")
+CATEGORY_DOMAIN_SPECIFIC = sys.intern("domain_specific")
+
+# Identical payload tail shared by every stress-test data chunk
+_STRESS_CHUNK_ITEMS = " ".join(f"item_{j}" for j in range(10))
+
+# Template for the generated capacity-test entries: item id, timestamp, category, status
+_CAPACITY_ITEM = (
+    "Memory item {0}: This is a test entry containing information about item number {0}. "
+    "It includes details like timestamp {1}, category type-{2}, and status active-{3}."
+).format
+
+# Suite name -> (category, factory method), so suites can be listed without building their workloads
+SUITE_REGISTRY = {
+    "Conversational AI Memory": (CATEGORY_CONVERSATIONAL, "conversational_ai_suite"),
+    "Long Context Memory": (CATEGORY_LONG_CONTEXT, "long_context_suite"),
+    "Persona Consistency": (CATEGORY_CONVERSATIONAL, "persona_consistency_suite"),
+    "Technical Performance": (CATEGORY_TECHNICAL, "technical_performance_suite"),
+    "Domain-Specific Applications": (CATEGORY_DOMAIN_SPECIFIC, "domain_specific_suite"),
+    "Memory Stress Testing": (CATEGORY_TECHNICAL, "memory_stress_suite")
+}
 
 
 class StandardBenchmarks:
@@ -27,29 +62,19 @@ class StandardBenchmarks:
     @staticmethod
     def get_all_suites() -> List[BenchmarkSuite]:
         """Get all available benchmark suites."""
-        return [
-            StandardBenchmarks.conversational_ai_suite(),
-            StandardBenchmarks.long_context_suite(),
-            StandardBenchmarks.persona_consistency_suite(),
-            StandardBenchmarks.technical_performance_suite(),
-            StandardBenchmarks.domain_specific_suite(),
-            StandardBenchmarks.memory_stress_suite()
-        ]
+        return list(_all_suites())
     
     @staticmethod
     def get_suite_by_category(category: str) -> List[BenchmarkSuite]:
         """Get benchmark suites by category."""
-        all_suites = StandardBenchmarks.get_all_suites()
-        return [suite for suite in all_suites if suite.category == category]
+        return [_build_suite(name) for name in _available_benchmarks().get(sys.intern(category), ())]
     
     @staticmethod
     def get_suite_by_name(name: str) -> Optional[BenchmarkSuite]:
-        """Get a specific benchmark suite by name."""
-        all_suites = StandardBenchmarks.get_all_suites()
-        for suite in all_suites:
-            if suite.name == name:
-                return suite
-        return None
+        """Get a specific benchmark suite by name, building it on first use."""
+        if name not in SUITE_REGISTRY:
+            return None
+        return _build_suite(name)
     
     @staticmethod
     def conversational_ai_suite() -> BenchmarkSuite:
@@ -135,7 +160,7 @@ class StandardBenchmarks:
         return BenchmarkSuite(
             name="Conversational AI Memory",
             description="Benchmarks based on conversational AI datasets (MSC, PersonaChat)",
-            category="conversational",
+            category=CATEGORY_CONVERSATIONAL,
             workloads=workloads,
             reference="Xu et al. 2021 (MSC), Zhang et al. 2018 (PersonaChat)",
             metrics=["persona_consistency", "fact_accuracy", "memory_retention", "response_relevance"]
@@ -220,7 +245,7 @@ class StandardBenchmarks:
         return BenchmarkSuite(
             name="Long Context Memory",
             description="Benchmarks for long-context memory retention (LongBench/InfiniteBench style)",
-            category="long_context",
+            category=CATEGORY_LONG_CONTEXT,
             workloads=workloads,
             reference="Bai et al. 2023 (LongBench), Zhang et al. 2024 (InfiniteBench)",
             metrics=["retrieval_accuracy", "context_retention", "information_synthesis"]
@@ -268,7 +293,7 @@ class StandardBenchmarks:
         return BenchmarkSuite(
             name="Persona Consistency",
             description="Benchmarks for maintaining consistent persona and identity",
-            category="conversational",
+            category=CATEGORY_CONVERSATIONAL,
             workloads=workloads,
             reference="Character consistency evaluation frameworks",
             metrics=["persona_consistency", "expertise_accuracy", "role_adherence"]
@@ -280,27 +305,24 @@ class StandardBenchmarks:
         workloads = []
         
         # High-frequency operations
-        stress_workload = Workload(
+        chunk_ids = range(20)
+        probe_ids = range(0, 20, 5)
+        contents = [f"Data chunk {i}: {_STRESS_CHUNK_ITEMS}" for i in chunk_ids]
+        contents.extend(f"What was in data chunk {i}?" for i in probe_ids)
+        actions = ["store"] * len(chunk_ids)
+        actions.extend(["retrieve"] * len(probe_ids))
+        stress_workload = Workload.from_columns(
             name="Memory System Stress Test",
             description="High-frequency memory operations to test system limits",
-            steps=[
-                WorkloadStep(
-                    action="store",
-                    content=f"Data chunk {i}: {' '.join([f'item_{j}' for j in range(10)])}"
-                ) for i in range(20)
-            ] + [
-                WorkloadStep(
-                    action="retrieve",
-                    content=f"What was in data chunk {i}?"
-                ) for i in range(0, 20, 5)
-            ]
+            actions=actions,
+            contents=contents
         )
         workloads.append(stress_workload)
         
         return BenchmarkSuite(
             name="Technical Performance",
             description="Technical benchmarks for memory system performance evaluation",
-            category="technical",
+            category=CATEGORY_TECHNICAL,
             workloads=workloads,
             reference="AdaptMemBench, AISBench methodologies",
             metrics=["latency", "throughput", "memory_efficiency", "error_rate"]
@@ -343,7 +365,7 @@ class StandardBenchmarks:
         return BenchmarkSuite(
             name="Domain-Specific Applications",
             description="Real-world domain-specific memory scenarios",
-            category="domain_specific",
+            category=CATEGORY_DOMAIN_SPECIFIC,
             workloads=workloads,
             reference="Industry-specific use case analysis",
             metrics=["task_completion", "context_accuracy", "domain_relevance"]
@@ -355,72 +377,103 @@ class StandardBenchmarks:
         workloads = []
         
         # Memory capacity test
-        capacity_workload = Workload(
+        item_ids = range(50)
+        probe_ids = [0, 10, 25, 35, 49]  # Test various positions
+        contents = [_CAPACITY_ITEM(i, i*100, i%5, i%3) for i in item_ids]
+        contents.extend(f"What do you know about memory item {i}?" for i in probe_ids)
+        metadatas = [{"item_id": i, "category": i%5, "status": i%3} for i in item_ids]
+        metadatas.extend({"type": "capacity_test", "item_id": i} for i in probe_ids)
+        actions = ["store"] * len(item_ids)
+        actions.extend(["retrieve"] * len(probe_ids))
+        capacity_workload = Workload.from_columns(
             name="Memory Capacity Test",
             description="Tests memory system capacity and retention under load",
-            steps=[
-                WorkloadStep(
-                    action="store",
-                    content=f"Memory item {i}: This is a test entry containing information about item number {i}. It includes details like timestamp {i*100}, category type-{i%5}, and status active-{i%3}.",
-                    metadata={"item_id": i, "category": i%5, "status": i%3}
-                ) for i in range(50)
-            ] + [
-                WorkloadStep(
-                    action="retrieve",
-                    content=f"What do you know about memory item {i}?",
-                    metadata={"type": "capacity_test", "item_id": i}
-                ) for i in [0, 10, 25, 35, 49]  # Test various positions
-            ]
+            actions=actions,
+            contents=contents,
+            metadatas=metadatas
         )
         workloads.append(capacity_workload)
         
         return BenchmarkSuite(
             name="Memory Stress Testing",
             description="Stress testing for memory system limits and performance",
-            category="technical",
+            category=CATEGORY_TECHNICAL,
             workloads=workloads,
             reference="Memory system stress testing methodologies",
             metrics=["capacity_limit", "retention_accuracy", "performance_degradation"]
         )
 
 
+@lru_cache(maxsize=None)
+def _build_suite(name: str) -> BenchmarkSuite:
+    """Build a registered suite once; later lookups reuse the same instance."""
+    _, factory = SUITE_REGISTRY[name]
+    return getattr(StandardBenchmarks, factory)()
+
+
+@lru_cache(maxsize=1)
+def _all_suites() -> tuple:
+    """All registered suites, in registry order."""
+    return tuple(StandardBenchmarks.get_suite_by_name(name) for name in SUITE_REGISTRY)
+
+
+@lru_cache(maxsize=1)
+def _available_benchmarks() -> Dict[str, tuple]:
+    """Suite names grouped by category, read from the registry alone."""
+    categories = {}
+    for name, (category, _) in SUITE_REGISTRY.items():
+        categories.setdefault(category, []).append(name)
+    return {category: tuple(names) for category, names in categories.items()}
+
+
+@lru_cache(maxsize=None)
+def _benchmark_info(benchmark_name: str) -> Optional[Dict[str, Any]]:
+    """Summary of a suite; callers get a deep copy since the cached dict is shared."""
+    suite = StandardBenchmarks.get_suite_by_name(benchmark_name)
+    if suite is None:
+        return None
+    return _suite_info(suite)
+
+
+def _suite_info(suite: BenchmarkSuite) -> Dict[str, Any]:
+    """Summary dict for a suite, read straight from its attributes."""
+    return {
+        "name": suite.name,
+        "description": suite.description,
+        "category": suite.category,
+        "num_workloads": len(suite.workloads),
+        "reference": suite.reference,
+        "recommended_metrics": list(suite.metrics) if suite.metrics is not None else None,
+        "workload_names": [w.name for w in suite.workloads]
+    }
+
+
 class BenchmarkRunner:
     """Helper class for running benchmark suites with MemoryComparator."""
     
     @staticmethod
     def get_available_benchmarks() -> Dict[str, List[str]]:
         """Get available benchmarks organized by category."""
-        suites = StandardBenchmarks.get_all_suites()
-        categories = {}
-        for suite in suites:
-            if suite.category not in categories:
-                categories[suite.category] = []
-            categories[suite.category].append(suite.name)
-        return categories
+        return {category: list(names) for category, names in _available_benchmarks().items()}
     
     @staticmethod
     def get_benchmark_info(benchmark_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific benchmark."""
-        suites = StandardBenchmarks.get_all_suites()
-        for suite in suites:
-            if suite.name == benchmark_name:
-                return {
-                    "name": suite.name,
-                    "description": suite.description,
-                    "category": suite.category,
-                    "num_workloads": len(suite.workloads),
-                    "reference": suite.reference,
-                    "recommended_metrics": suite.metrics,
-                    "workload_names": [w.name for w in suite.workloads]
-                }
-        return None
+        # Deep copy: the cached dict holds lists (metrics, workload names) callers could mutate
+        return copy.deepcopy(_benchmark_info(benchmark_name))
     
     @staticmethod
-    def create_benchmark_report(results: Dict[str, Any], suite_name: str) -> Dict[str, Any]:
-        """Create a specialized report for benchmark results."""
-        suite_info = BenchmarkRunner.get_benchmark_info(suite_name)
-        if not suite_info:
-            return results
+    def create_benchmark_report(results: Dict[str, Any], suite: Union[str, BenchmarkSuite]) -> Dict[str, Any]:
+        """Create a specialized report for benchmark results.
+        
+        ``suite`` is a suite name or an already resolved suite; an unknown name
+        returns ``results`` unchanged.
+        """
+        if isinstance(suite, str):
+            suite = StandardBenchmarks.get_suite_by_name(suite)
+            if suite is None:
+                return results
+        suite_info = _suite_info(suite)
         
         # Add benchmark-specific analysis
         benchmark_report = {
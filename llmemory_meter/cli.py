@@ -6,15 +6,33 @@ Provides a simple CLI to run benchmarks using YAML configuration.
 
 import argparse
 import asyncio
+import os
 import sys
-from pathlib import Path
+import traceback
+from typing import List, Optional
 
-from llmemory_meter.config_parser import ConfigManager
+from llmemory_meter import install_fast_loop, log_progress_to_stdout
+from llmemory_meter.config_parser import ConfigManager, IssueKind
 from llmemory_meter.comparator import MemoryComparator
 
 
-async def run_benchmarks(config_file: str = None, verbose: bool = False):
-    """Run benchmarks using configuration file."""
+# Quick-result line printed per tool after each suite
+_TOOL_LINE = "   {suite} / {tool}: {rate:.1f}% success, {latency:.0f}ms avg".format
+
+_EPILOG = """
+Examples:
+  llmemory run                                # Run with default config
+  llmemory run --config my_config.yml        # Run with custom config
+  llmemory run --config configs/example.yml  # Run with example config
+  llmemory run --only "Long Context Memory"  # Run a single enabled suite
+  llmemory create-config                      # Create default config file
+  llmemory create-config --output custom.yml # Create custom config file
+        """
+
+
+async def run_benchmarks(config_file: str = None, verbose: bool = False,
+                         only: Optional[List[str]] = None, skip: Optional[List[str]] = None):
+    """Run benchmarks using configuration file, optionally narrowed with ``only``/``skip``."""
     
     print("🧠 LLMemoryMeter - AI Memory System Benchmarking")
     print("=" * 60)
@@ -32,16 +50,16 @@ async def run_benchmarks(config_file: str = None, verbose: bool = False):
     print("\n🔍 Validating configuration...")
     issues = ConfigManager.validate_config(config)
     if issues:
-        print("❌ Configuration issues found:")
-        for issue in issues:
-            print(f"   • {issue}")
+        lines = ["❌ Configuration issues found:"]
+        lines.extend(f"   • {issue}" for issue in issues)
         
-        if any("Missing API key" in issue for issue in issues):
-            print("\n💡 Setup instructions:")
-            print("   1. Copy .env.example to .env")
-            print("   2. Add your API keys to .env file")
-            print("   3. Run the command again")
+        if any(issue.kind is IssueKind.MISSING_KEY for issue in issues):
+            lines.append("\n💡 Setup instructions:")
+            lines.append("   1. Copy .env.example to .env")
+            lines.append("   2. Add your API keys to .env file")
+            lines.append("   3. Run the command again")
         
+        print("\n".join(lines))
         return False
     
     print("✅ Configuration valid")
@@ -50,74 +68,122 @@ async def run_benchmarks(config_file: str = None, verbose: bool = False):
     enabled_tools = ConfigManager.get_enabled_tools(config)
     enabled_benchmarks = ConfigManager.get_enabled_benchmarks(config)
     
-    print(f"\n🔧 Memory Tools to test: {len(enabled_tools)}")
+    # Narrow the enabled suites before anything is built, so filtered-out suites cost nothing
+    if only:
+        wanted = set(only)
+        unknown = wanted.difference(enabled_benchmarks)
+        if unknown:
+            print(f"⚠️  Not enabled in config, ignoring: {', '.join(sorted(unknown))}")
+        enabled_benchmarks = [b for b in enabled_benchmarks if b in wanted]
+    if skip:
+        skipped = set(skip)
+        enabled_benchmarks = [b for b in enabled_benchmarks if b not in skipped]
+    if not enabled_benchmarks:
+        print("❌ No benchmarks left to run after applying --only/--skip")
+        return False
+    
+    # Build the plan as one block so it is written in a single call
+    tool_configs = ConfigManager.get_tool_configs(config)
+    lines = [f"\n🔧 Memory Tools to test: {len(enabled_tools)}"]
     for tool in enabled_tools:
-        tool_config = ConfigManager.get_tool_config(config, tool)
-        model = tool_config.model if tool_config and tool_config.model else "default"
-        print(f"   • {tool} ({model})")
+        model = tool_configs[tool].model or "default"
+        lines.append(f"   • {tool} ({model})")
     
-    print(f"\n📊 Benchmarks to run: {len(enabled_benchmarks)}")
-    for benchmark in enabled_benchmarks:
-        print(f"   • {benchmark}")
+    lines.append(f"\n📊 Benchmarks to run: {len(enabled_benchmarks)}")
+    lines.extend(f"   • {benchmark}" for benchmark in enabled_benchmarks)
+    print("\n".join(lines))
     
     # Initialize comparator with config
     print(f"\n🚀 Initializing memory tools...")
+    stream_file = None
     try:
-        comparator = MemoryComparator()
+        # Comparator settings (tool_concurrency, max_concurrency, ...) come from the general section
+        comparator = MemoryComparator(config.general)
+        
+        save_results = config.output.get('save_results', True)
+        output_file = config.output.get('output_file', 'benchmark_results.json')
+        print_summary = config.output.get('print_summary', True)
         
-        # Run benchmarks
+        # Streaming writes one JSON line per suite as it finishes instead of one document at the end,
+        # so the file gets a .jsonl suffix in place of whatever output_file has
+        if save_results and config.output.get('stream_results', False):
+            output_file = os.path.splitext(output_file)[0] + '.jsonl'
+            stream_file = open(output_file, 'wb')
+        
+        # Run benchmarks; suites are independent, so run them concurrently (bounded). Each suite gets
+        # its own tool instances, so one suite's stored memories can't leak into another's, while
+        # max_concurrency and tool_concurrency still bound the run as a whole
         print(f"\n🧪 Running benchmarks...")
-        all_results = {}
+        suite_semaphore = asyncio.Semaphore(config.general.get('max_concurrent_benchmarks', 4))
         
-        for benchmark_name in enabled_benchmarks:
-            print(f"\n--- Running: {benchmark_name} ---")
-            
-            try:
-                results = await comparator.run_benchmark_suite(benchmark_name, enabled_tools)
-                all_results[benchmark_name] = results
+        async def run_suite(benchmark_name):
+            async with suite_semaphore:
+                print(f"\n--- Running: {benchmark_name} ---")
                 
-                # Show quick results
-                if "standard_results" in results and "overall_metrics" in results["standard_results"]:
-                    metrics = results["standard_results"]["overall_metrics"]
-                    for tool_name, tool_metrics in metrics.items():
-                        success_rate = tool_metrics.get('success_rate', 0)
-                        avg_latency = tool_metrics.get('avg_latency_ms', 0)
-                        print(f"   {tool_name}: {success_rate:.1f}% success, {avg_latency:.0f}ms avg")
+                try:
+                    async with comparator.isolated_copy() as suite_comparator:
+                        results = await suite_comparator.run_benchmark_suite(benchmark_name, enabled_tools)
+                    
+                    # Show quick results, one write per suite so concurrent suites don't interleave lines
+                    if "standard_results" in results and "overall_metrics" in results["standard_results"]:
+                        metrics = results["standard_results"]["overall_metrics"]
+                        lines = []
+                        for tool_name, tool_metrics in metrics.items():
+                            success_rate = tool_metrics.get('success_rate', 0)
+                            avg_latency = tool_metrics.get('avg_latency_ms', 0)
+                            lines.append(_TOOL_LINE(suite=benchmark_name, tool=tool_name, rate=success_rate, latency=avg_latency))
+                        if lines:
+                            print("\n".join(lines))
+                    
+                except Exception as e:
+                    print(f"   ❌ {benchmark_name} failed: {e}")
+                    if verbose:
+                        traceback.print_exc()
+                    results = {"error": str(e)}
                 
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
-                if verbose:
-                    import traceback
-                    traceback.print_exc()
-                all_results[benchmark_name] = {"error": str(e)}
+                if stream_file is None:
+                    return benchmark_name, results
+                
+                comparator.write_result_line(stream_file, {"benchmark": benchmark_name, "result": results})
+                # Once streamed, only the part the summary reads needs to stay in memory
+                if print_summary and "standard_results" in results:
+                    return benchmark_name, {"standard_results": results["standard_results"]}
+                return benchmark_name, {}
+        
+        all_results = dict(await asyncio.gather(*(run_suite(name) for name in enabled_benchmarks)))
         
         # Generate final report
         print(f"\n📈 Generating final report...")
         
+        run_config = {
+            "tools": enabled_tools,
+            "benchmarks": enabled_benchmarks,
+            "metrics": config.metrics.__dict__
+        }
+        
         # Save results if configured
-        if config.output.get('save_results', True):
-            output_file = config.output.get('output_file', 'benchmark_results.json')
-            
+        if stream_file is not None:
+            comparator.write_result_line(stream_file, {"config": run_config})
+            print(f"💾 Results streamed to: {output_file}")
+        elif save_results:
             # Save detailed results
             final_results = {
-                "config": {
-                    "tools": enabled_tools,
-                    "benchmarks": enabled_benchmarks,
-                    "metrics": config.metrics.__dict__
-                },
+                "config": run_config,
                 "results": all_results
             }
             
-            comparator.save_results(final_results, output_file)
+            await comparator.save_results_async(final_results, output_file, binary=config.output.get('binary', False))
             print(f"💾 Results saved to: {output_file}")
         
         # Print summary if configured
-        if config.output.get('print_summary', True):
-            # Create summary from all results
-            summary_results = {}
-            for benchmark_name, benchmark_results in all_results.items():
-                if "standard_results" in benchmark_results:
-                    summary_results.update(benchmark_results["standard_results"])
+        if print_summary:
+            # Create summary from all results (later suites win on key clashes, as before)
+            summary_results = {
+                key: value
+                for benchmark_results in all_results.values()
+                if "standard_results" in benchmark_results
+                for key, value in benchmark_results["standard_results"].items()
+            }
             
             if summary_results:
                 comparator.print_summary(summary_results)
@@ -128,27 +194,29 @@ async def run_benchmarks(config_file: str = None, verbose: bool = False):
     except Exception as e:
         print(f"\n❌ Error during benchmarking: {e}")
         if verbose:
-            import traceback
             traceback.print_exc()
         return False
+    
+    finally:
+        if stream_file is not None:
+            stream_file.close()
 
 
 def create_config_command(args):
     """Create default configuration file."""
     config_file = args.output or ConfigManager.DEFAULT_CONFIG_FILE
     
-    if Path(config_file).exists() and not args.force:
-        print(f"❌ Config file {config_file} already exists. Use --force to overwrite.")
-        return False
-    
     try:
-        created_file = ConfigManager.save_default_config(config_file)
+        created_file = ConfigManager.save_default_config(config_file, force=args.force)
         print(f"✅ Created configuration file: {created_file}")
         print(f"\n📝 Next steps:")
         print(f"   1. Edit {created_file} to customize your benchmarks")
         print(f"   2. Set up your API keys in .env file")
         print(f"   3. Run: llmemory-meter run --config {created_file}")
         return True
+    except FileExistsError:
+        print(f"❌ Config file {config_file} already exists. Use --force to overwrite.")
+        return False
     except Exception as e:
         print(f"❌ Error creating config: {e}")
         return False
@@ -159,14 +227,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="LLMemoryMeter - AI Memory System Benchmarking Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  llmemory run                                # Run with default config
-  llmemory run --config my_config.yml        # Run with custom config
-  llmemory run --config configs/example.yml  # Run with example config
-  llmemory create-config                      # Create default config file
-  llmemory create-config --output custom.yml # Create custom config file
-        """
+        epilog=_EPILOG
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -175,6 +236,8 @@ Examples:
     run_parser = subparsers.add_parser('run', help='Run benchmarks')
     run_parser.add_argument('--config', '-c', help='Configuration file path')
     run_parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    run_parser.add_argument('--only', nargs='+', metavar='SUITE', help='Run only these enabled benchmark suites')
+    run_parser.add_argument('--skip', nargs='+', metavar='SUITE', help='Skip these benchmark suites')
     
     # Create config command
     config_parser = subparsers.add_parser('create-config', help='Create default configuration file')
@@ -184,7 +247,9 @@ Examples:
     args = parser.parse_args()
     
     if args.command == 'run':
-        success = asyncio.run(run_benchmarks(args.config, args.verbose))
+        install_fast_loop()
+        log_progress_to_stdout()
+        success = asyncio.run(run_benchmarks(args.config, args.verbose, args.only, args.skip))
         sys.exit(0 if success else 1)
     
     elif args.command == 'create-config':
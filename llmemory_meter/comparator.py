@@ -1,15 +1,74 @@
 """Main comparison engine for memory tools."""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import importlib
+import logging
+import sys
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import replace
+from typing import Awaitable, List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from itertools import groupby
 import json
 
-from llmemory_meter.memory_tools import MemoryTool, Mem0Tool, OpenAIMemoryTool, ZepTool
-from llmemory_meter.workload import Workload, WorkloadResult
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Send dataclasses and datetimes through default=str, like the json fallback
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+from llmemory_meter.memory_tools.base import MemoryTool
+from llmemory_meter.workload import Workload, WorkloadResult, WorkloadStep, StepResult
 from llmemory_meter.metrics import MetricsCalculator
 from llmemory_meter.config_parser import Config
-from llmemory_meter.benchmarks import StandardBenchmarks, BenchmarkRunner
+from llmemory_meter.benchmarks import StandardBenchmarks, BenchmarkRunner, SUITE_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Tool name -> (module, class); a tool's module is only imported when the tool is first used
+_TOOL_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "mem0": ("llmemory_meter.memory_tools.mem0_tool", "Mem0Tool"),
+    "openai_memory": ("llmemory_meter.memory_tools.openai_memory_tool", "OpenAIMemoryTool"),
+    "zep": ("llmemory_meter.memory_tools.zep_tool", "ZepTool"),
+}
+
+# Tool names MemoryComparator knows how to build
+SUPPORTED_TOOLS = frozenset(_TOOL_REGISTRY)
+
+
+async def _settle(coro: Awaitable[Any]) -> Any:
+    """Await ``coro``, handing back its exception instead of raising it."""
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
+
+async def _gather_settled(coros: List[Awaitable[Any]]) -> List[Any]:
+    """Run ``coros`` concurrently and return their results or exceptions, in order.
+    
+    On Python 3.11+ the runs are scoped to a TaskGroup, so none of them can outlive the
+    call (e.g. if the caller is cancelled) and skew the timing of whatever runs next.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_settle(coro)) for coro in coros]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*coros, return_exceptions=True)
 
 
 class MemoryComparator:
@@ -19,19 +78,47 @@ class MemoryComparator:
         self.config = config or {}
         self.available_tools = Config.get_available_tools()
         self._tool_instances: Dict[str, MemoryTool] = {}
+        self._tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Opt-in LRU cache of retrieve results, keyed by (tool, store generation, action, content digest)
+        self._result_cache: "OrderedDict[Tuple[str, int, str, bytes], StepResult]" = OrderedDict()
+        self._store_generations: Dict[str, int] = {}
+        # Bounds in-flight (workload, tool) runs across every benchmark on this comparator and its isolated copies
+        self._run_semaphore = asyncio.Semaphore(self.config.get("max_concurrency", Config.MAX_CONCURRENCY))
+    
+    def isolated_copy(self) -> "MemoryComparator":
+        """A comparator with its own tool instances and result cache, sharing this one's concurrency limits.
+        
+        Runs on the copy count against the same ``max_concurrency`` and per-tool
+        ``tool_concurrency`` bounds as runs on this comparator.
+        """
+        copy = type(self)(self.config)
+        copy._run_semaphore = self._run_semaphore
+        copy._tool_semaphores = self._tool_semaphores
+        return copy
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close all tool instances, releasing their pooled connections."""
+        for tool in self._tool_instances.values():
+            await tool.aclose()
+        self._tool_instances.clear()
     
     def _get_tool_instance(self, tool_name: str) -> MemoryTool:
         """Get or create a tool instance."""
         if tool_name not in self._tool_instances:
+            entry = _TOOL_REGISTRY.get(tool_name)
+            if entry is None:
+                raise ValueError(f"Unknown tool: {tool_name}. Supported tools: {', '.join(_TOOL_REGISTRY)}")
+            
             try:
-                if tool_name == "mem0":
-                    self._tool_instances[tool_name] = Mem0Tool(self.config.get("mem0", {}))
-                elif tool_name == "openai_memory":
-                    self._tool_instances[tool_name] = OpenAIMemoryTool(self.config.get("openai_memory", {}))
-                elif tool_name == "zep":
-                    self._tool_instances[tool_name] = ZepTool(self.config.get("zep", {}))
-                else:
-                    raise ValueError(f"Unknown tool: {tool_name}. Supported tools: mem0, openai_memory, zep")
+                module_name, class_name = entry
+                tool_class = getattr(importlib.import_module(module_name), class_name)
+                self._tool_instances[tool_name] = tool_class(self.config.get(tool_name, {}))
             except (ValueError, ImportError) as e:
                 # Re-raise configuration and import errors
                 raise e
@@ -41,23 +128,111 @@ class MemoryComparator:
         
         return self._tool_instances[tool_name]
     
+    def _get_tool_semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent workloads on a tool."""
+        if tool_name not in self._tool_semaphores:
+            # Tools keep per-instance state, so workloads on the same tool run one at a time unless
+            # tool_concurrency is raised; concurrency then only comes from running different tools
+            self._tool_semaphores[tool_name] = asyncio.Semaphore(self.config.get("tool_concurrency", 1))
+        return self._tool_semaphores[tool_name]
+    
+    def _invalidate_cached_retrievals(self, tool_name: str):
+        """Mark cached retrievals stale after a store or chat, since either can change what they return."""
+        if self.config.get("invalidate_on_store", True):
+            self._store_generations[tool_name] = self._store_generations.get(tool_name, 0) + 1
+    
+    async def _execute_step(self, tool_name: str, tool: MemoryTool, step: WorkloadStep, step_index: int) -> StepResult:
+        """Execute a step, serving repeated retrievals from the result cache when enabled."""
+        if not self.config.get("cache_results", False):
+            return await tool.execute_step(step, step_index)
+        
+        # Chat steps can write to memory too (tools may record the exchange), so they invalidate as well
+        if step.action in ("store", "chat"):
+            self._invalidate_cached_retrievals(tool_name)
+            return await tool.execute_step(step, step_index)
+        
+        if step.action != "retrieve":
+            return await tool.execute_step(step, step_index)
+        
+        start_ns = time.perf_counter_ns()
+        key = (
+            tool_name,
+            self._store_generations.get(tool_name, 0),
+            step.action,
+            step.content_key
+        )
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            # A hit costs only the lookup, so report that rather than the original call's latency
+            return replace(
+                cached,
+                step_index=step_index,
+                latency_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+                retries_used=0,
+                metadata={**(cached.metadata or {}), "cached": True}
+            )
+        
+        result = await tool.execute_step(step, step_index)
+        if result.success:
+            self._result_cache[key] = result
+            if len(self._result_cache) > self.config.get("cache_size", 4096):
+                self._result_cache.popitem(last=False)
+        return result
+    
+    def _resolve_tools(self, tool_names: List[str]) -> Tuple[Dict[str, MemoryTool], Dict[str, Exception]]:
+        """Look up (or create) each tool once, splitting usable instances from initialization errors."""
+        instances, failures = {}, {}
+        for tool_name in tool_names:
+            try:
+                instances[tool_name] = self._get_tool_instance(tool_name)
+            except Exception as e:
+                failures[tool_name] = e
+        return instances, failures
+    
     async def run_workload_on_tool(self, workload: Workload, tool_name: str) -> WorkloadResult:
         """Run a workload on a specific memory tool."""
-        tool = self._get_tool_instance(tool_name)
-        step_results = []
-        total_start_time = datetime.now()
-        
-        for i, step in enumerate(workload.steps):
-            step_result = await tool.execute_step(step, i)
-            step_results.append(step_result)
+        return await self._run_workload(workload, tool_name, self._get_tool_instance(tool_name))
+    
+    async def _run_workload(self, workload: Workload, tool_name: str, tool: MemoryTool,
+                            run_slot: Optional[asyncio.Semaphore] = None) -> WorkloadResult:
+        """Run a workload on an already resolved tool instance.
         
-        total_end_time = datetime.now()
-        total_latency_ms = (total_end_time - total_start_time).total_seconds() * 1000
+        ``run_slot`` is only acquired once the tool's own semaphore is held, so runs queued
+        behind a busy tool don't take slots other tools could use.
+        """
+        async with self._get_tool_semaphore(tool_name), run_slot or nullcontext():
+            step_results = []
+            timestamp = datetime.now()  # wall-clock start, for the record only
+            start_ns = time.perf_counter_ns()
+            
+            batch_stores = self.config.get("batch_stores", False)
+            for action, group in groupby(enumerate(workload.steps), key=lambda item: item[1].action):
+                group = list(group)
+                if batch_stores and action == "store" and len(group) > 1:
+                    # Coalesce consecutive stores into one bulk call
+                    self._invalidate_cached_retrievals(tool_name)
+                    step_results.extend(await tool.execute_store_batch([step for _, step in group], group[0][0]))
+                    continue
+                if workload.dependency_parallel and action != "chat" and len(group) > 1:
+                    # Independent run of stores or retrieves: overlap the round-trips
+                    step_results.extend(await asyncio.gather(*[
+                        self._execute_step(tool_name, tool, step, i) for i, step in group
+                    ]))
+                    continue
+                for i, step in group:
+                    step_result = await self._execute_step(tool_name, tool, step, i)
+                    step_results.append(step_result)
+            
+            total_latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
-        # Calculate aggregated metrics
-        successful_steps = sum(1 for r in step_results if r.success)
+        # Calculate aggregated metrics in a single pass
+        successful_steps = 0
+        total_tokens = 0
+        for r in step_results:
+            successful_steps += r.success
+            total_tokens += r.tokens_used or 0
         success_rate = successful_steps / len(step_results) if step_results else 0
-        total_tokens = sum(r.tokens_used or 0 for r in step_results)
         
         return WorkloadResult(
             tool_name=tool_name,
@@ -66,7 +241,7 @@ class MemoryComparator:
             total_latency_ms=total_latency_ms,
             total_tokens_used=total_tokens,
             success_rate=success_rate,
-            timestamp=total_start_time
+            timestamp=timestamp
         )
     
     async def compare_tools(self, workload: Workload, tools: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -78,59 +253,93 @@ class MemoryComparator:
             raise ValueError("No tools available. Please check your API key configuration.")
         
         # Run workload on all tools concurrently
-        tasks = []
-        for tool_name in tools:
-            if tool_name in ["mem0", "openai_memory", "zep"]:  # Supported tools
-                task = self.run_workload_on_tool(workload, tool_name)
-                tasks.append((tool_name, task))
-        
-        results = {}
-        for tool_name, task in tasks:
+        supported_tools = [tool_name for tool_name in tools if tool_name in SUPPORTED_TOOLS]
+        instances, outcomes_by_tool = self._resolve_tools(supported_tools)
+        
+        if len(instances) == 1 and not outcomes_by_tool:
+            # A single tool needs no gather machinery; await it directly
+            (tool_name, tool), = instances.items()
             try:
-                result = await task
-                results[tool_name] = result
+                outcome = await self._run_workload(workload, tool_name, tool)
             except Exception as e:
-                print(f"Error running {tool_name}: {e}")
-                # Create a failed result
-                results[tool_name] = WorkloadResult(
-                    tool_name=tool_name,
-                    workload_name=workload.name,
-                    step_results=[],
-                    total_latency_ms=0,
-                    total_tokens_used=0,
-                    success_rate=0,
-                    timestamp=datetime.now()
-                )
-        
-        return results
+                outcome = e
+            return {tool_name: self._result_or_failure(tool_name, workload, outcome)}
+        
+        outcomes = await _gather_settled(
+            [self._run_workload(workload, tool_name, tool) for tool_name, tool in instances.items()]
+        )
+        outcomes_by_tool.update(zip(instances, outcomes))
+        
+        return {
+            tool_name: self._result_or_failure(tool_name, workload, outcomes_by_tool[tool_name])
+            for tool_name in supported_tools
+        }
+    
+    def _result_or_failure(self, tool_name: str, workload: Workload, outcome: Any) -> WorkloadResult:
+        """Pass a WorkloadResult through; turn an exception from the run into an empty failed result."""
+        if isinstance(outcome, WorkloadResult):
+            return outcome
+        
+        logger.error("Error running %s: %s", tool_name, outcome)
+        return WorkloadResult(
+            tool_name=tool_name,
+            workload_name=workload.name,
+            step_results=[],
+            total_latency_ms=0,
+            total_tokens_used=0,
+            success_rate=0,
+            timestamp=datetime.now()
+        )
+    
+    async def _run_guarded(self, workload: Workload, tool_name: str, tool: MemoryTool) -> WorkloadResult:
+        """Run one (workload, tool) pair once a slot in the shared run semaphore is free."""
+        return await self._run_workload(workload, tool_name, tool, self._run_semaphore)
     
     async def benchmark_tools(self, workloads: List[Workload], tools: Optional[List[str]] = None) -> Dict[str, Any]:
         """Run comprehensive benchmark across multiple workloads."""
         if tools is None:
             tools = self.available_tools
         
-        all_results = {tool: [] for tool in tools}
+        if not tools:
+            raise ValueError("No tools available. Please check your API key configuration.")
+        
+        # Per-tool (latencies, token_counts, successful, total, retries) columns, filled while regrouping
+        columns = {tool: ([], [], 0, 0, 0) for tool in tools}
         workload_comparisons = {}
         
-        # Run each workload
-        for workload in workloads:
-            print(f"Running workload: {workload.name}")
-            comparison = await self.compare_tools(workload, tools)
-            workload_comparisons[workload.name] = comparison
-            
-            # Collect results for each tool
-            for tool_name, result in comparison.items():
-                all_results[tool_name].append(result)
-        
-        # Calculate overall metrics
-        overall_metrics = {}
-        for tool_name, results in all_results.items():
-            if results:  # Only calculate if we have results
-                try:
-                    metrics = MetricsCalculator.calculate_metrics(results)
-                    overall_metrics[tool_name] = metrics
-                except Exception as e:
-                    print(f"Error calculating metrics for {tool_name}: {e}")
+        # Run every (workload, tool) pair as its own task, bounded so slow providers aren't flooded
+        # Tools are resolved once here rather than once per pair
+        supported_tools = [tool_name for tool_name in tools if tool_name in SUPPORTED_TOOLS]
+        instances, failures = self._resolve_tools(supported_tools)
+        pairs = [(workload, tool_name) for workload in workloads for tool_name in supported_tools]
+        if logger.isEnabledFor(logging.INFO):
+            for workload in workloads:
+                logger.info("Running workload: %s", workload.name)
+        runs = [(workload, tool_name) for workload, tool_name in pairs if tool_name in instances]
+        outcomes = await _gather_settled(
+            [self._run_guarded(workload, tool_name, instances[tool_name]) for workload, tool_name in runs]
+        )
+        run_outcomes = iter(outcomes)
+        
+        # Regroup by workload (tools in requested order) and by tool (workloads in suite order)
+        for workload, tool_name in pairs:
+            outcome = next(run_outcomes) if tool_name in instances else failures[tool_name]
+            result = self._result_or_failure(tool_name, workload, outcome)
+            workload_comparisons.setdefault(workload.name, {})[tool_name] = result
+            latencies, token_counts, successful, total, retries = columns[tool_name]
+            latencies.extend(result.latencies_ms)
+            token_counts.extend(result.token_counts)
+            columns[tool_name] = (
+                latencies, token_counts, successful + result.n_success, total + result.n_steps,
+                retries + result.n_retries
+            )
+        
+        # Calculate overall metrics in one pass; tools that produced no steps get none
+        overall_metrics = MetricsCalculator.calculate_metrics_batch(columns)
+        if workloads:
+            for tool_name in supported_tools:
+                if tool_name not in overall_metrics:
+                    logger.error("Error calculating metrics for %s: no step results", tool_name)
         
         # Compare metrics
         metrics_list = list(overall_metrics.values())
@@ -169,26 +378,21 @@ class MemoryComparator:
             tools = self.available_tools
         
         # Get the benchmark suite
-        all_suites = StandardBenchmarks.get_all_suites()
-        suite = None
-        for s in all_suites:
-            if s.name == suite_name:
-                suite = s
-                break
+        suite = StandardBenchmarks.get_suite_by_name(suite_name)
         
         if not suite:
-            raise ValueError(f"Benchmark suite '{suite_name}' not found. Available suites: {[s.name for s in all_suites]}")
+            raise ValueError(f"Benchmark suite '{suite_name}' not found. Available suites: {list(SUITE_REGISTRY)}")
         
-        print(f"🧪 Running benchmark suite: {suite.name}")
-        print(f"📝 Description: {suite.description}")
-        print(f"📊 Category: {suite.category}")
-        print(f"🔧 Testing {len(suite.workloads)} workloads on {len(tools)} tools")
+        logger.info(
+            "🧪 Running benchmark suite: %s\n📝 Description: %s\n📊 Category: %s\n🔧 Testing %d workloads on %d tools",
+            suite.name, suite.description, suite.category, len(suite.workloads), len(tools)
+        )
         
         # Run the benchmark
         results = await self.benchmark_tools(suite.workloads, tools)
         
         # Create specialized benchmark report
-        benchmark_report = BenchmarkRunner.create_benchmark_report(results, suite_name)
+        benchmark_report = BenchmarkRunner.create_benchmark_report(results, suite)
         
         return benchmark_report
     
@@ -197,35 +401,61 @@ class MemoryComparator:
         if tools is None:
             tools = self.available_tools
         
-        all_suites = StandardBenchmarks.get_all_suites()
+        # Iterate registry names so each suite is only built when its turn comes
+        suite_names = list(SUITE_REGISTRY)
         all_results = {}
         
-        print(f"🚀 Running all {len(all_suites)} benchmark suites...")
+        logger.info("🚀 Running all %d benchmark suites...", len(suite_names))
         
-        for suite in all_suites:
-            print(f"\n--- Running: {suite.name} ---")
+        for suite_name in suite_names:
+            logger.info("\n--- Running: %s ---", suite_name)
             try:
-                suite_results = await self.run_benchmark_suite(suite.name, tools)
-                all_results[suite.name] = suite_results
+                suite_results = await self.run_benchmark_suite(suite_name, tools)
+                all_results[suite_name] = suite_results
             except Exception as e:
-                print(f"❌ Error running {suite.name}: {e}")
-                all_results[suite.name] = {"error": str(e)}
+                logger.error("❌ Error running %s: %s", suite_name, e)
+                all_results[suite_name] = {"error": str(e)}
         
         return {
             "all_benchmark_results": all_results,
             "summary": {
-                "total_suites": len(all_suites),
+                "total_suites": len(suite_names),
                 "successful_suites": len([r for r in all_results.values() if "error" not in r]),
                 "tools_tested": tools,
                 "timestamp": datetime.now().isoformat()
             }
         }
     
-    def save_results(self, results: Dict[str, Any], filename: str):
-        """Save benchmark results to a JSON file."""
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"Results saved to {filename}")
+    def save_results(self, results: Dict[str, Any], filename: str, binary: bool = False):
+        """Save benchmark results to a JSON file, or to MessagePack when ``binary`` is set."""
+        if binary:
+            if not MSGPACK_AVAILABLE:
+                raise ImportError("msgpack not found. Install with: pip install msgpack")
+            with open(filename, 'wb') as f:
+                f.write(msgpack.packb(results, default=str))
+        elif ORJSON_AVAILABLE:
+            # Same layout as the json fallback: dataclasses and datetimes go through str()
+            payload = orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | _ORJSON_OPTIONS)
+            with open(filename, 'wb') as f:
+                f.write(payload)
+        else:
+            # Encode in one go: json.dump would issue a write() per encoder chunk
+            payload = json.dumps(results, indent=2, default=str)
+            with open(filename, 'w') as f:
+                f.write(payload)
+        logger.info("Results saved to %s", filename)
+    
+    def write_result_line(self, f, record: Dict[str, Any]):
+        """Append one record as a JSON line to a file opened in binary mode."""
+        if ORJSON_AVAILABLE:
+            f.write(orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE | _ORJSON_OPTIONS))
+        else:
+            f.write(json.dumps(record, default=str).encode() + b"\n")
+        f.flush()
+    
+    async def save_results_async(self, results: Dict[str, Any], filename: str, binary: bool = False):
+        """Save benchmark results without blocking the event loop on encoding and disk I/O."""
+        await asyncio.get_running_loop().run_in_executor(None, self.save_results, results, filename, binary)
     
     def print_summary(self, results: Dict[str, Any]):
         """Print a formatted summary of benchmark results."""
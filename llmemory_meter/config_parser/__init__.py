@@ -5,7 +5,9 @@ Handles both environment-based configuration and YAML-based configuration.
 """
 
 from llmemory_meter.config_parser.env import Config
-from llmemory_meter.config_parser.manager import ConfigManager, LLMemoryMeterConfig, MemoryToolConfig, BenchmarkConfig, MetricsConfig
+from llmemory_meter.config_parser.manager import (
+    ConfigManager, LLMemoryMeterConfig, MemoryToolConfig, BenchmarkConfig, MetricsConfig, ConfigIssue, IssueKind
+)
 
 __all__ = [
     "Config",
@@ -13,5 +15,7 @@ __all__ = [
     "LLMemoryMeterConfig",
     "MemoryToolConfig",
     "BenchmarkConfig", 
-    "MetricsConfig"
+    "MetricsConfig",
+    "ConfigIssue",
+    "IssueKind"
 ]
@@ -21,32 +21,50 @@ class Config:
     # Performance settings
     DEFAULT_TIMEOUT: int = int(os.getenv("DEFAULT_TIMEOUT", "30"))
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    RETRY_DEADLINE_S: float = float(os.getenv("RETRY_DEADLINE_S", "5"))
+    MAX_CONCURRENCY: int = int(os.getenv("MAX_CONCURRENCY", "16"))
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     
     # Memory tool settings
     SUPPORTED_TOOLS = ["mem0", "openai_memory"]
     
+    # Results of the key checks below; they only depend on the class attributes above
+    _api_keys_cache: Optional[dict] = None
+    _available_tools_cache: Optional[list] = None
+    
     @classmethod
     def validate_api_keys(cls) -> dict:
         """Validate which API keys are available."""
-        available_keys = {}
-        
-        if cls.MEM0_API_KEY:
-            available_keys["mem0"] = True
-        if cls.OPENAI_API_KEY:
-            available_keys["openai_memory"] = True
+        if cls._api_keys_cache is None:
+            available_keys = {}
+            
+            if cls.MEM0_API_KEY:
+                available_keys["mem0"] = True
+            if cls.OPENAI_API_KEY:
+                available_keys["openai_memory"] = True
             
-        return available_keys
+            cls._api_keys_cache = available_keys
+        
+        return dict(cls._api_keys_cache)
     
     @classmethod
     def get_available_tools(cls) -> list:
         """Get list of tools that can be used based on available API keys."""
-        available_keys = cls.validate_api_keys()
-        available_tools = []
-        
-        if available_keys.get("mem0"):
-            available_tools.append("mem0")
-        if available_keys.get("openai_memory"):
-            available_tools.append("openai_memory")
+        if cls._available_tools_cache is None:
+            available_keys = cls.validate_api_keys()
+            available_tools = []
             
-        return available_tools
+            if available_keys.get("mem0"):
+                available_tools.append("mem0")
+            if available_keys.get("openai_memory"):
+                available_tools.append("openai_memory")
+            
+            cls._available_tools_cache = available_tools
+        
+        return list(cls._available_tools_cache)
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget cached key checks, e.g. after changing the API key attributes in tests."""
+        cls._api_keys_cache = None
+        cls._available_tools_cache = None
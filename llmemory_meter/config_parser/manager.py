@@ -5,10 +5,18 @@ Handles YAML-based configuration for memory tools, benchmarks, and metrics.
 """
 
 import os
+import copy
+import enum
 import yaml
-from typing import Dict, Any, List, Optional
+
+# Prefer the libyaml-backed loader/dumper; fall back to the pure-Python ones without libyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from llmemory_meter.config_parser.env import Config as EnvConfig
 
 
@@ -40,6 +48,43 @@ class MetricsConfig:
     memory_quality: bool = False  # Future feature
 
 
+# Accepted keys per config section, so unknown YAML keys can be dropped instead of raising TypeError
+_MEMORY_TOOL_FIELDS = frozenset(f.name for f in fields(MemoryToolConfig))
+_BENCHMARK_FIELDS = frozenset(f.name for f in fields(BenchmarkConfig))
+_METRICS_FIELDS = frozenset(f.name for f in fields(MetricsConfig))
+
+
+def _known_fields(section_dict: Dict[str, Any], allowed: frozenset, section: str) -> Dict[str, Any]:
+    """Keep only keys the section's dataclass accepts, warning about the rest."""
+    unknown = section_dict.keys() - allowed
+    if not unknown:
+        return section_dict
+    print(f"⚠️  Ignoring unknown {section} keys: {', '.join(sorted(unknown))}")
+    return {k: v for k, v in section_dict.items() if k in allowed}
+
+
+# Parsed configs keyed by (absolute path, mtime_ns, size), so an unchanged file is parsed once
+_config_cache: Dict[Tuple[str, int, int], "LLMemoryMeterConfig"] = {}
+
+
+class IssueKind(enum.IntEnum):
+    """Kinds of problem reported by ConfigManager.validate_config."""
+    NO_TOOLS = 1
+    MISSING_KEY = 2
+    NO_BENCHMARKS = 3
+    MISSING_OUTPUT_DIR = 4
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigIssue:
+    """A single configuration problem; prints as its message."""
+    kind: IssueKind
+    message: str
+    
+    def __str__(self) -> str:
+        return self.message
+
+
 @dataclass
 class LLMemoryMeterConfig:
     """Main configuration for LLMemoryMeter."""
@@ -122,21 +167,27 @@ class ConfigManager:
                 "timeout": 30,
                 "max_retries": 3,
                 "concurrent_tools": True,
+                "max_concurrent_benchmarks": 4,
+                "tool_concurrency": 1,
                 "debug": False
             }
         )
     
     @staticmethod
-    def save_default_config(file_path: str = None) -> str:
-        """Save default configuration to YAML file."""
+    def save_default_config(file_path: str = None, force: bool = True) -> str:
+        """Save default configuration to YAML file.
+        
+        With ``force=False`` the file is created exclusively and FileExistsError
+        is raised if it already exists.
+        """
         if file_path is None:
             file_path = ConfigManager.DEFAULT_CONFIG_FILE
         
         config = ConfigManager.create_default_config()
         config_dict = asdict(config)
         
-        with open(file_path, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2, sort_keys=False)
+        with open(file_path, 'w' if force else 'x') as f:
+            yaml.dump(config_dict, f, Dumper=_SafeDumper, default_flow_style=False, indent=2, sort_keys=False)
         
         return file_path
     
@@ -153,11 +204,19 @@ class ConfigManager:
             print(f"✅ Created default config: {file_path}")
         
         try:
-            with open(file_path, 'r') as f:
-                config_dict = yaml.safe_load(f)
+            stat = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            config = _config_cache.get(cache_key)
+            if config is None:
+                with open(file_path, 'r') as f:
+                    config_dict = yaml.load(f, Loader=_SafeLoader)
+                
+                # Convert dict to dataclass
+                config = ConfigManager._dict_to_config(config_dict)
+                _config_cache[cache_key] = config
             
-            # Convert dict to dataclass
-            return ConfigManager._dict_to_config(config_dict)
+            # Hand out a copy so callers can't change what later loads return
+            return copy.deepcopy(config)
         
         except Exception as e:
             print(f"❌ Error loading config from {file_path}: {e}")
@@ -168,18 +227,20 @@ class ConfigManager:
     def _dict_to_config(config_dict: Dict[str, Any]) -> LLMemoryMeterConfig:
         """Convert dictionary to LLMemoryMeterConfig."""
         # Convert memory tools
-        memory_tools = []
-        for tool_dict in config_dict.get('memory_tools', []):
-            memory_tools.append(MemoryToolConfig(**tool_dict))
+        memory_tools = [
+            MemoryToolConfig(**_known_fields(tool_dict, _MEMORY_TOOL_FIELDS, 'memory_tools'))
+            for tool_dict in config_dict.get('memory_tools', [])
+        ]
         
         # Convert benchmarks
-        benchmarks = []
-        for bench_dict in config_dict.get('benchmarks', []):
-            benchmarks.append(BenchmarkConfig(**bench_dict))
+        benchmarks = [
+            BenchmarkConfig(**_known_fields(bench_dict, _BENCHMARK_FIELDS, 'benchmarks'))
+            for bench_dict in config_dict.get('benchmarks', [])
+        ]
         
         # Convert metrics
         metrics_dict = config_dict.get('metrics', {})
-        metrics = MetricsConfig(**metrics_dict)
+        metrics = MetricsConfig(**_known_fields(metrics_dict, _METRICS_FIELDS, 'metrics'))
         
         return LLMemoryMeterConfig(
             memory_tools=memory_tools,
@@ -190,21 +251,23 @@ class ConfigManager:
         )
     
     @staticmethod
-    def validate_config(config: LLMemoryMeterConfig) -> List[str]:
+    def validate_config(config: LLMemoryMeterConfig) -> List[ConfigIssue]:
         """Validate configuration and return list of issues."""
         issues = []
         
         # Check if any tools are enabled
         enabled_tools = [tool for tool in config.memory_tools if tool.enabled]
         if not enabled_tools:
-            issues.append("No memory tools are enabled")
+            issues.append(ConfigIssue(IssueKind.NO_TOOLS, "No memory tools are enabled"))
         
         # Check API keys for enabled tools
         for tool in enabled_tools:
             if tool.api_key_env:
                 api_key = os.getenv(tool.api_key_env)
                 if not api_key:
-                    issues.append(f"Missing API key: {tool.api_key_env} for tool '{tool.name}'")
+                    issues.append(ConfigIssue(
+                        IssueKind.MISSING_KEY, f"Missing API key: {tool.api_key_env} for tool '{tool.name}'"
+                    ))
             
             # Check additional API keys (e.g., OpenAI for Mem0)
             if tool.name == "mem0" and tool.settings:
@@ -212,31 +275,31 @@ class ConfigManager:
                 if llm_key_env:
                     llm_key = os.getenv(llm_key_env)
                     if not llm_key:
-                        issues.append(f"Missing LLM API key: {llm_key_env} for Mem0")
+                        issues.append(ConfigIssue(IssueKind.MISSING_KEY, f"Missing LLM API key: {llm_key_env} for Mem0"))
         
         # Check if any benchmarks are enabled
         enabled_benchmarks = [bench for bench in config.benchmarks if bench.enabled]
         if not enabled_benchmarks:
-            issues.append("No benchmarks are enabled")
+            issues.append(ConfigIssue(IssueKind.NO_BENCHMARKS, "No benchmarks are enabled"))
         
         # Check output directory
         output_file = config.output.get('output_file')
         if output_file:
             output_dir = os.path.dirname(output_file)
             if output_dir and not os.path.exists(output_dir):
-                issues.append(f"Output directory does not exist: {output_dir}")
+                issues.append(ConfigIssue(IssueKind.MISSING_OUTPUT_DIR, f"Output directory does not exist: {output_dir}"))
         
         return issues
     
     @staticmethod
     def get_enabled_tools(config: LLMemoryMeterConfig) -> List[str]:
-        """Get list of enabled tool names."""
-        return [tool.name for tool in config.memory_tools if tool.enabled]
+        """Get list of enabled tool names, in config order without duplicates."""
+        return list(dict.fromkeys(tool.name for tool in config.memory_tools if tool.enabled))
     
     @staticmethod
     def get_enabled_benchmarks(config: LLMemoryMeterConfig) -> List[str]:
-        """Get list of enabled benchmark names."""
-        return [bench.name for bench in config.benchmarks if bench.enabled]
+        """Get list of enabled benchmark names, in config order without duplicates."""
+        return list(dict.fromkeys(bench.name for bench in config.benchmarks if bench.enabled))
     
     @staticmethod
     def get_tool_config(config: LLMemoryMeterConfig, tool_name: str) -> Optional[MemoryToolConfig]:
@@ -245,3 +308,12 @@ class ConfigManager:
             if tool.name == tool_name:
                 return tool
         return None
+    
+    @staticmethod
+    def get_tool_configs(config: LLMemoryMeterConfig) -> Dict[str, MemoryToolConfig]:
+        """Get configuration for every tool, keyed by tool name."""
+        tool_configs = {}
+        for tool in config.memory_tools:
+            # First entry wins, matching get_tool_config
+            tool_configs.setdefault(tool.name, tool)
+        return tool_configs
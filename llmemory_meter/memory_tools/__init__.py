@@ -5,10 +5,17 @@ This package contains implementations for different AI memory systems.
 Each memory tool is implemented as a separate module for better organization.
 """
 
+import importlib
+
 from llmemory_meter.memory_tools.base import MemoryTool
-from llmemory_meter.memory_tools.mem0_tool import Mem0Tool
-from llmemory_meter.memory_tools.openai_memory_tool import OpenAIMemoryTool
-from llmemory_meter.memory_tools.zep_tool import ZepTool
+
+# Tool classes are imported on first access (PEP 562), so importing the package (or
+# memory_tools.base) doesn't load every tool module and its SDK up front.
+_LAZY_IMPORTS = {
+    "Mem0Tool": "llmemory_meter.memory_tools.mem0_tool",
+    "OpenAIMemoryTool": "llmemory_meter.memory_tools.openai_memory_tool",
+    "ZepTool": "llmemory_meter.memory_tools.zep_tool",
+}
 
 __all__ = [
     "MemoryTool",
@@ -16,3 +23,11 @@ __all__ = [
     "OpenAIMemoryTool",
     "ZepTool"
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
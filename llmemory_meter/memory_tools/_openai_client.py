@@ -0,0 +1,68 @@
+"""
+Shared AsyncOpenAI Client
+
+One pooled AsyncOpenAI client per (event loop, API key), so concurrent steps reuse
+keep-alive connections instead of queueing on a small default pool. When the h2
+package is installed, requests are multiplexed over HTTP/2. Clients are bound to
+the loop they were created on, since httpx connections cannot be reused across loops.
+
+Each tool holds a reference to the client it uses; the client is closed when the
+last holder releases it, so one tool's aclose never closes a client others still use.
+"""
+
+import asyncio
+import weakref
+from typing import Dict, List
+
+try:
+    import h2  # noqa: F401 - only needed by httpx's HTTP/2 transport
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool sized for concurrent steps and workloads sharing one client
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 50
+_TIMEOUT_S = 30.0
+
+# Per loop and API key: [client, number of holders]
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, List]]" = weakref.WeakKeyDictionary()
+
+
+def acquire_async_client(api_key: str):
+    """Return the AsyncOpenAI client for ``api_key`` on the running loop, creating it on first use.
+    
+    Every acquire must be paired with a release_async_client on the same loop.
+    """
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    entry = loop_clients.get(api_key)
+    if entry is None:
+        import httpx
+        import openai
+
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=_MAX_CONNECTIONS,
+                    max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=_TIMEOUT_S
+            )
+        )
+        entry = loop_clients[api_key] = [client, 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def release_async_client(api_key: str):
+    """Drop one hold on the running loop's client for ``api_key``, closing it after the last one."""
+    loop_clients = _clients.get(asyncio.get_running_loop(), {})
+    entry = loop_clients.get(api_key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del loop_clients[api_key]
+        await entry[0].close()
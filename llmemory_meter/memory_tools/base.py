@@ -5,11 +5,58 @@ Defines the interface that all memory tools must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import json
+import random
 import time
+from contextvars import ContextVar
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from llmemory_meter.workload import WorkloadStep, StepResult
+from llmemory_meter.config_parser import Config
+from llmemory_meter.memory_tools.query_cache import QueryCache
+
+# Backoff before retry n (0-based) is drawn uniformly from [0, min(_RETRY_MAX_DELAY_S, _RETRY_MULTIPLIER_S * 2**n)]
+_RETRY_MULTIPLIER_S = 0.2
+_RETRY_MAX_DELAY_S = 2.0
+
+# Exception class-name fragments that mark a failure as worth retrying; matching by name covers
+# the SDKs' own timeout/connection/rate-limit errors without importing them
+_TRANSIENT_NAME_HINTS = ("Timeout", "RateLimit", "Connection")
+
+# Stage timings (name -> ms) recorded by the step execute_step is running; context-local,
+# so concurrent steps on the same tool each collect their own
+_STEP_STAGES: ContextVar[Optional[Dict[str, float]]] = ContextVar("step_stages", default=None)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether an error (or one it wraps) looks like a timeout, dropped connection or rate limit."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (TimeoutError, ConnectionError)):
+            return True
+        if any(hint in type(exc).__name__ for hint in _TRANSIENT_NAME_HINTS):
+            return True
+        # Tools re-raise SDK errors as plain Exceptions; the original is kept as the cause/context
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def format_memories(query: str, memories: List[Tuple[str, float]]) -> str:
+    """Serialize retrieved (text, score) pairs once, as ``{"query": ..., "memories": [{"text", "score"}]}``."""
+    payload = {"query": query, "memories": [{"text": text, "score": score} for text, score in memories]}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, ensure_ascii=False)
 
 
 class MemoryTool(ABC):
@@ -19,6 +66,17 @@ class MemoryTool(ABC):
         self.name = name
         self.config = config or {}
         self._session_id = f"{name}_{int(time.time())}"
+        # Opt-in cache of query answers; tools that use it clear it whenever they store
+        cache_size = self.config.get("query_cache_size", 0)
+        self._query_cache = (
+            QueryCache(cache_size, self.config.get("query_cache_ttl_s", 300)) if cache_size else None
+        )
+        # Step action -> handler, so execute_step dispatches with one lookup
+        self._action_handlers = {
+            "store": self.store_memory,
+            "retrieve": self.retrieve_memory,
+            "chat": self.chat
+        }
     
     @abstractmethod
     async def store_memory(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -35,22 +93,80 @@ class MemoryTool(ABC):
         """Have a conversation using memory context."""
         pass
     
+    async def store_many(self, contents: List[str],
+                         metadatas: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[str]:
+        """Store several memories, returning one response per content.
+        
+        The default stores them concurrently one by one; tools whose backend can take
+        a whole batch in one request override this.
+        """
+        metadatas = metadatas or [None] * len(contents)
+        return list(await asyncio.gather(*[
+            self.store_memory(content, metadata) for content, metadata in zip(contents, metadatas)
+        ]))
+    
+    @property
+    def _has_bulk_store(self) -> bool:
+        """Whether this tool overrides store_many with a real bulk request."""
+        return type(self).store_many is not MemoryTool.store_many
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Release network resources held by the tool."""
+        pass
+    
+    @staticmethod
+    def _record_stage(stage: str, elapsed_ms: float):
+        """Record a stage timing for the running step, reported as its ``stages_ms`` metadata."""
+        stages = _STEP_STAGES.get()
+        if stages is not None:
+            stages[stage] = elapsed_ms
+    
     async def execute_step(self, step: WorkloadStep, step_index: int) -> StepResult:
-        """Execute a single workload step and measure performance."""
-        start_time = time.time()
+        """Execute a single workload step and measure performance.
+        
+        Transient failures (timeouts, dropped connections, rate limits) are retried
+        up to ``max_retries`` times with jittered exponential backoff, but never past
+        ``retry_deadline_s`` after the first attempt started. The reported latency covers
+        every attempt and the backoff between them, and ``retries_used`` counts the retries.
+        Stores are not idempotent (a failed attempt may already have written), so they
+        are only retried when ``retry_stores`` is set.
+        """
+        start_ns = time.perf_counter_ns()
         tokens_used = 0
+        attempt = 0
+        stages: Dict[str, float] = {}
+        stages_token = _STEP_STAGES.set(stages)
         
         try:
-            if step.action == "store":
-                response = await self.store_memory(step.content, step.metadata)
-            elif step.action == "retrieve":
-                response = await self.retrieve_memory(step.content, step.metadata)
-            elif step.action == "chat":
-                response = await self.chat(step.content, step.metadata)
-            else:
+            handler = self._action_handlers.get(step.action)
+            if handler is None:
                 raise ValueError(f"Unknown action: {step.action}")
             
-            latency_ms = (time.time() - start_time) * 1000
+            max_retries = self.config.get("max_retries", Config.MAX_RETRIES)
+            if step.action == "store" and not self.config.get("retry_stores", False):
+                max_retries = 0
+            deadline_ns = start_ns + int(self.config.get("retry_deadline_s", Config.RETRY_DEADLINE_S) * 1e9)
+            while True:
+                try:
+                    response = await handler(step.content, step.metadata)
+                    break
+                except Exception as e:
+                    if attempt >= max_retries or not _is_transient(e):
+                        raise
+                    delay_s = random.uniform(0, min(_RETRY_MAX_DELAY_S, _RETRY_MULTIPLIER_S * 2 ** attempt))
+                    if time.perf_counter_ns() + delay_s * 1e9 > deadline_ns:
+                        raise
+                    await asyncio.sleep(delay_s)
+                    attempt += 1
+                    stages.clear()  # only the attempt that produced the outcome is reported
+            
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
             
             return StepResult(
                 step_index=step_index,
@@ -58,11 +174,13 @@ class MemoryTool(ABC):
                 response=response,
                 latency_ms=latency_ms,
                 tokens_used=tokens_used,
-                success=True
+                success=True,
+                metadata={"stages_ms": stages} if stages else None,
+                retries_used=attempt
             )
             
         except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
             return StepResult(
                 step_index=step_index,
                 action=step.action,
@@ -70,5 +188,44 @@ class MemoryTool(ABC):
                 latency_ms=latency_ms,
                 tokens_used=0,
                 success=False,
-                error_message=str(e)
+                error_message=str(e),
+                retries_used=attempt
+            )
+        
+        finally:
+            _STEP_STAGES.reset(stages_token)
+    
+    async def execute_store_batch(self, steps: List[WorkloadStep], start_index: int) -> List[StepResult]:
+        """Execute a run of consecutive store steps.
+        
+        Tools with a bulk ``store_many`` get a single call, whose latency is split
+        evenly across the steps; otherwise the stores run concurrently, each timed
+        on its own.
+        """
+        if not steps or not self._has_bulk_store:
+            return list(await asyncio.gather(*[
+                self.execute_step(step, start_index + offset) for offset, step in enumerate(steps)
+            ]))
+        
+        start_ns = time.perf_counter_ns()
+        try:
+            responses = await self.store_many([step.content for step in steps], [step.metadata for step in steps])
+            error_message = None
+        except Exception as e:
+            responses = [""] * len(steps)
+            error_message = str(e)
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6 / len(steps)
+        
+        return [
+            StepResult(
+                step_index=start_index + offset,
+                action=step.action,
+                response=response,
+                latency_ms=latency_ms,
+                tokens_used=0,
+                success=error_message is None,
+                error_message=error_message,
+                metadata={"batch_size": len(steps)}
             )
+            for offset, (step, response) in enumerate(zip(steps, responses))
+        ]
@@ -5,11 +5,32 @@ Provides integration with Mem0 AI memory system.
 """
 
 import asyncio
-from typing import Dict, Any, Optional
+import hashlib
+from functools import partial, wraps
+from typing import Dict, Any, List, Optional
 
-from llmemory_meter.memory_tools.base import MemoryTool
+from llmemory_meter.memory_tools.base import MemoryTool, format_memories
+from llmemory_meter.memory_tools.query_cache import QueryCache, query_key
 from llmemory_meter.config_parser import Config
 
+def _cache_embeddings(memory, cache: QueryCache):
+    """Route the Mem0 client's embedder through ``cache``, keyed by SHA-256 of (memory action, text)."""
+    embedder = getattr(memory, "embedding_model", None)
+    embed = getattr(embedder, "embed", None)
+    if embed is None:
+        return
+    
+    @wraps(embed)
+    def cached_embed(text, memory_action=None):
+        key = hashlib.sha256(f"{memory_action}|{text}".encode()).digest()
+        vector = cache.get(key)
+        if vector is None:
+            vector = embed(text, memory_action)
+            cache.set(key, vector)
+        return vector
+    
+    embedder.embed = cached_embed
+
 
 class Mem0Tool(MemoryTool):
     """Mem0 memory tool implementation with real API calls."""
@@ -31,6 +52,7 @@ class Mem0Tool(MemoryTool):
         """Initialize the Mem0 client with proper configuration."""
         try:
             from mem0 import Memory
+            self._memory_cls = Memory
 
             # Use Mem0 cloud instead of local Qdrant
             self.mem0_config = {
@@ -52,8 +74,18 @@ class Mem0Tool(MemoryTool):
                 }
             }
             
+        except ImportError:
+            raise ImportError("mem0ai package not installed. Install with: pip install mem0ai")
+        
+        # Built here, outside any measured step: from_config blocks and may do network I/O
+        self.memory = self._build_memory()
+    
+    def _build_memory(self):
+        """Build the Mem0 client, falling back to a simpler config if the vector store fails."""
+        Memory = self._memory_cls
+        try:
             try:
-                self.memory = Memory.from_config(self.mem0_config)
+                memory = Memory.from_config(self.mem0_config)
                 print("✅ Mem0 initialized with vector store")
             except Exception as e:
                 print(f"⚠️  Vector store failed, using simple config: {e}")
@@ -69,52 +101,99 @@ class Mem0Tool(MemoryTool):
                         }
                     }
                 }
-                self.memory = Memory.from_config(simple_config)
+                memory = Memory.from_config(simple_config)
                 print("✅ Mem0 initialized with simple config")
-            
-        except ImportError:
-            raise ImportError("mem0ai package not installed. Install with: pip install mem0ai")
+            # Opt-in, like the query cache: hits skip real embedding calls, so they change what
+            # Mem0 latency measures. The cache belongs to this tool instance only.
+            if self.config.get("cache_embeddings", False):
+                _cache_embeddings(memory, QueryCache(max_size=10000, ttl_seconds=3600))
+            return memory
         except Exception as e:
             raise Exception(f"Failed to initialize Mem0: {e}")
     
+    async def _search(self, query: str, limit: int):
+        """Search Mem0 for ``query``, answering repeats from the query cache when it is enabled."""
+        if self._query_cache is not None:
+            key = query_key(self._user_id, query, limit)
+            results = self._query_cache.get(key)
+            if results is not None:
+                return results
+        
+        results = await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(self.memory.search, query, user_id=self._user_id, limit=limit)
+        )
+        if self._query_cache is not None:
+            self._query_cache.set(key, results)
+        return results
+    
     async def store_memory(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Store memory in Mem0."""
         try:
-            result = self.memory.add(content, user_id=self._user_id, metadata=metadata)
+            if self._query_cache is not None:
+                self._query_cache.clear()
+            # Mem0's client is synchronous; keep it off the event loop so other tools overlap
+            result = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(self.memory.add, content, user_id=self._user_id, metadata=metadata)
+            )
             memory_id = result.get('id', 'unknown') if isinstance(result, dict) else str(result)
             return f"Stored in Mem0 (ID: {memory_id}): {content[:50]}..."
         except Exception as e:
             raise Exception(f"Mem0 store failed: {e}")
     
+    async def store_many(self, contents: List[str],
+                         metadatas: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[str]:
+        """Store several memories in one Mem0 add call, passed as a list of user messages.
+        
+        Mem0 reads the messages of one add as a single conversation when it extracts
+        facts. It also takes only one metadata dict per add, so a batch whose metadata
+        differs is stored item by item instead.
+        """
+        metadatas = metadatas or [None]
+        if any(m != metadatas[0] for m in metadatas):
+            return await super().store_many(contents, metadatas)
+        metadata = metadatas[0]
+        
+        try:
+            if self._query_cache is not None:
+                self._query_cache.clear()
+            
+            messages = [{"role": "user", "content": content} for content in contents]
+            result = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(self.memory.add, messages, user_id=self._user_id, metadata=metadata)
+            )
+            memory_id = result.get('id', 'unknown') if isinstance(result, dict) else str(result)
+            return [f"Stored in Mem0 (ID: {memory_id}): {content[:50]}..." for content in contents]
+        except Exception as e:
+            raise Exception(f"Mem0 store failed: {e}")
+    
     async def retrieve_memory(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Retrieve memory from Mem0."""
         try:
-            results = self.memory.search(query, user_id=self._user_id, limit=3)
+            results = await self._search(query, 3)
 
             # Handle different response formats
             if isinstance(results, dict):
                 results = results.get('results', [])
 
+            memories = []
             if results and hasattr(results, '__iter__'):
-                memories = []
                 # Safely iterate through results
                 for result in list(results)[:3]:
                     if isinstance(result, dict):
                         memory_text = result.get('memory', result.get('text', 'No content'))
-                        score = result.get('score', 0)
-                        memories.append(f"[Score: {score:.3f}] {memory_text}")
-
-                if memories:
-                    return f"Retrieved from Mem0 for '{query}': " + " | ".join(memories)
+                        memories.append((memory_text, result.get('score', 0)))
 
-            return f"No memories found in Mem0 for query: '{query}'"
+            return format_memories(query, memories)
         except Exception as e:
             raise Exception(f"Mem0 retrieve failed: {e}")
     
     async def chat(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Chat with Mem0 memory context."""
         try:
-            relevant_memories = self.memory.search(message, user_id=self._user_id, limit=5)
+            relevant_memories = await self._search(message, 5)
             
             context = ""
             if relevant_memories:
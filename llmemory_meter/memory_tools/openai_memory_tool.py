@@ -5,13 +5,53 @@ Provides integration with OpenAI's memory capabilities.
 """
 
 import asyncio
+import heapq
+import math
 import time
-from typing import Dict, Any, Optional
+from array import array
+from collections import deque
+from operator import itemgetter, mul
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
-from llmemory_meter.memory_tools.base import MemoryTool
+from llmemory_meter.memory_tools.base import MemoryTool, format_memories
+from llmemory_meter.memory_tools._openai_client import acquire_async_client, release_async_client
+from llmemory_meter.memory_tools.query_cache import query_key
 from llmemory_meter.config_parser import Config
 
 
+def _unit(vector: List[float]) -> array:
+    """Scale an embedding to unit length (packed as float32), so a dot product is its cosine."""
+    norm = math.sqrt(math.fsum(x * x for x in vector)) or 1.0
+    return array("f", [x / norm for x in vector])
+
+
+def _sign_bits(vector: array) -> int:
+    """Binary-quantize an embedding: one bit per dimension, set where the component is positive."""
+    return int("".join("1" if x > 0 else "0" for x in vector), 2)
+
+
+# Candidates kept from the Hamming pre-filter per result, before the exact cosine rerank
+_CANDIDATES_PER_RESULT = 10
+
+# Most inputs the embeddings endpoint accepts in one request
+_EMBEDDING_BATCH_LIMIT = 2048
+
+# Most memories summarized in one request; each gets 100 output tokens, so larger
+# batches would run past the model's output-token cap
+_SUMMARY_BATCH_SIZE = 16
+
+# Opening system message of every chat request
+_CHAT_SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful assistant with access to stored memories. Use the memories to provide contextual responses."}
+
+
+def _stored_message(content: str, summary: Optional[str]) -> str:
+    """Store response for a memory, quoting its summary if it already has one."""
+    stored = f"Stored in OpenAI Memory: {content[:50]}..."
+    if summary is None:
+        return stored
+    return f"{stored} (Summary: {summary[:30]}...)"
+
+
 class OpenAIMemoryTool(MemoryTool):
     """OpenAI Memory tool implementation with real API calls."""
     
@@ -25,76 +65,306 @@ class OpenAIMemoryTool(MemoryTool):
         self.api_key = Config.OPENAI_API_KEY
         self._initialize_openai_client()
         
-        # Simple in-memory storage for this demo (in production, use persistent storage)
-        self.stored_memories = []
-        self.conversation_history = []
+        # Simple in-memory storage for this demo (in production, use persistent storage),
+        # kept as parallel columns so scans touch only the column they need. Only the newest
+        # max_memories are kept; row i of the columns holds memory number _first_row + i.
+        self._max_memories = self.config.get("max_memories", 10000)
+        self._first_row = 0
+        self._contents: List[str] = []
+        self._timestamps = array("d")
+        self._metadata: List[Dict[str, Any]] = []
+        self._summaries: List[Optional[str]] = []
+        # Search index (vector_search only): sign bits per row, and all unit embeddings
+        # back to back in one float32 buffer, row i at [i * dim, (i + 1) * dim)
+        self._bits: List[int] = []
+        self._embeddings = array("f")
+        self._dim = 0
+        # System message quoting the latest memories for chat, rebuilt on store rather than per chat
+        self._memory_context_message: Optional[Dict[str, str]] = None
+        # Only the last 3 exchanges are ever sent back, so only those are kept
+        self.conversation_history = deque(maxlen=6)
+        # Background summaries (see async_summary): new (memory number, content) pairs queue up
+        # and one worker summarizes whatever has piled up in a single request
+        self._summary_queue: Optional[asyncio.Queue] = None
+        self._summary_worker_task: Optional[asyncio.Task] = None
+        # Shared client held by this tool, and the loop it was acquired on
+        self._client = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def _initialize_openai_client(self):
-        """Initialize the OpenAI client."""
+        """Check the OpenAI SDK is installed and read the tool settings; the client is acquired on first use."""
         try:
-            import openai
-            self.client = openai.AsyncOpenAI(api_key=self.api_key)
+            import openai  # noqa: F401 - the client itself is built on first use
             self.model = self.config.get("model", "gpt-4o-mini")
-            print("✅ OpenAI client initialized")
+            self.embedding_model = self.config.get("embedding_model", "text-embedding-3-small")
+            # Opt-in: retrieve by nearest stored embeddings rather than asking the LLM over recent
+            # memories. Off by default so retrieve results stay comparable with earlier runs.
+            self._vector_search = self.config.get("vector_search", False)
+            # Optionally have the LLM answer from the top vector candidates (second stage)
+            self._rerank = self.config.get("rerank", False)
+            # Opt-in: write store summaries in the background instead of waiting for them. The
+            # worker's requests overlap later measured steps, so it is off by default.
+            self._async_summary = self.config.get("async_summary", False)
         except ImportError:
             raise ImportError("openai package not installed. Install with: pip install openai")
         except Exception as e:
             raise Exception(f"Failed to initialize OpenAI: {e}")
     
+    @property
+    def stored_memories(self) -> List[Dict[str, Any]]:
+        """Stored memories as one dict per row, for inspection."""
+        return [
+            {"content": content, "timestamp": timestamp, "metadata": metadata, "summary": summary}
+            for content, timestamp, metadata, summary
+            in zip(self._contents, self._timestamps, self._metadata, self._summaries)
+        ]
+    
+    def _append_rows(self, contents: List[str], metadatas: List[Optional[Dict[str, Any]]],
+                     embeddings: Optional[List[array]] = None) -> range:
+        """Append memories to every column at once, returning their memory numbers.
+        
+        The oldest memories are dropped once there are more than max_memories.
+        """
+        now = time.time()
+        self._contents.extend(contents)
+        self._timestamps.extend([now] * len(contents))
+        self._metadata.extend(metadata or {} for metadata in metadatas)
+        self._summaries.extend([None] * len(contents))
+        if embeddings is not None:
+            for embedding in embeddings:
+                self._dim = len(embedding)
+                self._bits.append(_sign_bits(embedding))
+                self._embeddings.extend(embedding)
+        
+        excess = len(self._contents) - self._max_memories
+        if excess > 0:
+            for column in (self._contents, self._timestamps, self._metadata, self._summaries, self._bits):
+                del column[:excess]
+            del self._embeddings[:excess * self._dim]
+            self._first_row += excess
+        
+        self._memory_context_message = {
+            "role": "system",
+            "content": "Your memories: " + " | ".join([
+                content[:100] for content in self._contents[-5:]  # Last 5 memories
+            ])
+        }
+        end = self._first_row + len(self._contents)
+        return range(end - len(contents), end)
+    
+    def _summary(self, row: int) -> Optional[str]:
+        """Summary of memory number ``row``, if written and the memory is still kept."""
+        index = row - self._first_row
+        return self._summaries[index] if index >= 0 else None
+    
+    @property
+    def client(self):
+        """Pooled AsyncOpenAI client shared by every tool using this key on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = acquire_async_client(self.api_key)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Drop unfinished background summaries and release this tool's hold on the shared client."""
+        worker = self._summary_worker_task
+        if worker is not None:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+            self._summary_worker_task = None
+        
+        # The client is closed once no other tool on this loop holds it
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await release_async_client(self.api_key)
+        self._client = self._client_loop = None
+    
+    async def _summarize(self, rows: Sequence[int], contents: Sequence[str]):
+        """Write a summary for each new memory in one request (at most _SUMMARY_BATCH_SIZE of them)."""
+        if len(rows) == 1:
+            system_prompt = "Create a concise summary of this information for memory storage:"
+            content = contents[0]
+        else:
+            # One numbered line per memory
+            system_prompt = "Create a concise one-line summary of each numbered item for memory storage, keeping the numbering:"
+            content = "\n".join(f"{i}. {content}" for i, content in enumerate(contents, 1))
+        
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": content}
+            ],
+            max_tokens=100 * len(rows),
+            temperature=0.1
+        )
+        
+        text = response.choices[0].message.content
+        if len(rows) == 1:
+            summaries = [text]
+        else:
+            summaries = [line.partition(". ")[2] or line for line in text.splitlines() if line.strip()]
+        for row, summary in zip(rows, summaries):
+            index = row - self._first_row  # the memory may have been dropped meanwhile
+            if index >= 0:
+                self._summaries[index] = summary
+    
+    async def _summary_worker(self, queue: asyncio.Queue):
+        """Summarize queued memories, up to _SUMMARY_BATCH_SIZE per request, until cancelled."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _SUMMARY_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            rows, contents = zip(*batch)
+            try:
+                # Bounded by the shared client's request timeout; asyncio.wait_for here could
+                # swallow aclose's cancellation and leave the worker running
+                await self._summarize(rows, contents)
+            except Exception:
+                pass  # a summary is optional, so failures are dropped
+    
+    async def _add_summaries(self, rows: range, contents: List[str]):
+        """Summarize new memories, queued for the background worker when async_summary is on."""
+        if not self._async_summary:
+            await asyncio.gather(*[
+                self._summarize(rows[offset:offset + _SUMMARY_BATCH_SIZE], contents[offset:offset + _SUMMARY_BATCH_SIZE])
+                for offset in range(0, len(rows), _SUMMARY_BATCH_SIZE)
+            ])
+            return
+        # Start the worker on first use (and again under a new event loop)
+        if self._summary_worker_task is None or self._summary_worker_task.done():
+            self._summary_queue = asyncio.Queue()
+            self._summary_worker_task = asyncio.create_task(self._summary_worker(self._summary_queue))
+        for item in zip(rows, contents):
+            self._summary_queue.put_nowait(item)
+    
+    async def _embed(self, text: str) -> array:
+        """Embed ``text`` as a unit vector."""
+        response = await self.client.embeddings.create(model=self.embedding_model, input=text)
+        return _unit(response.data[0].embedding)
+    
+    def _nearest(self, query_vector: array, k: int) -> List[Tuple[float, int]]:
+        """Top ``k`` (cosine score, row) pairs.
+        
+        Candidates are picked by Hamming distance between sign bits (XOR + popcount on
+        a single int), then only those are rescored with the full float32 vectors.
+        """
+        query_bits = _sign_bits(query_vector)
+        distances = [(query_bits ^ bits).bit_count() for bits in self._bits]
+        candidates = heapq.nsmallest(k * _CANDIDATES_PER_RESULT, range(len(distances)), key=distances.__getitem__)
+        embeddings, dim = self._embeddings, self._dim
+        scored = (
+            (sum(map(mul, query_vector, embeddings[row * dim:(row + 1) * dim])), row)
+            for row in candidates
+        )
+        return heapq.nlargest(k, scored, key=itemgetter(0))
+    
+    async def _vector_answer(self, query: str) -> str:
+        """Answer from the memories closest to ``query``.
+        
+        Without reranking the top 3 are returned with their scores (as format_memories
+        JSON); with it, the LLM answers from the top 10 candidates only. Stage timings
+        (embed, search, rerank) are reported in the step's ``stages_ms`` metadata.
+        """
+        start = time.perf_counter_ns()
+        query_vector = await self._embed(query)
+        embedded = time.perf_counter_ns()
+        nearest = self._nearest(query_vector, 10 if self._rerank else 3)
+        searched = time.perf_counter_ns()
+        self._record_stage("embed_ms", (embedded - start) / 1e6)
+        self._record_stage("search_ms", (searched - embedded) / 1e6)
+        
+        contents = self._contents
+        if not self._rerank:
+            return format_memories(query, [(contents[row], score) for score, row in nearest])
+        
+        answer = await self._llm_answer(query, [contents[row] for _, row in nearest])
+        self._record_stage("rerank_ms", (time.perf_counter_ns() - searched) / 1e6)
+        return answer
+    
+    async def _llm_answer(self, query: str, memories: List[str]) -> str:
+        """Ask the LLM to answer ``query`` from the given memory contents."""
+        memory_context = "\n".join([
+            f"Memory {i+1}: {content}" 
+            for i, content in enumerate(memories)
+        ])
+        
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": f"Based on these stored memories, answer the query. Memories:\n{memory_context}"},
+                {"role": "user", "content": query}
+            ],
+            max_tokens=200,
+            temperature=0.2
+        )
+        
+        return response.choices[0].message.content
+    
     async def store_memory(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Store memory using OpenAI (simulated with in-memory storage)."""
         try:
-            # Store the memory with timestamp and metadata
-            memory_entry = {
-                "content": content,
-                "timestamp": time.time(),
-                "metadata": metadata or {}
-            }
-            self.stored_memories.append(memory_entry)
+            if self._query_cache is not None:
+                self._query_cache.clear()
             
-            # Use OpenAI to create a summary/embedding for better retrieval
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Create a concise summary of this information for memory storage:"},
-                    {"role": "user", "content": content}
-                ],
-                max_tokens=100,
-                temperature=0.1
-            )
+            # Store the memory with timestamp and metadata (and its embedding, once fetched)
+            embeddings = [await self._embed(content)] if self._vector_search else None
+            rows = self._append_rows([content], [metadata], embeddings)
+            
+            # Use OpenAI to create a summary for the memory
+            await self._add_summaries(rows, [content])
+            return _stored_message(content, self._summary(rows[0]))
+        except Exception as e:
+            raise Exception(f"OpenAI store failed: {e}")
+    
+    async def store_many(self, contents: List[str],
+                         metadatas: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[str]:
+        """Store several memories with one embeddings request and one summary request per _SUMMARY_BATCH_SIZE."""
+        try:
+            if self._query_cache is not None:
+                self._query_cache.clear()
+            
+            embeddings = None
+            if self._vector_search:
+                embeddings = []
+                for offset in range(0, len(contents), _EMBEDDING_BATCH_LIMIT):
+                    response = await self.client.embeddings.create(
+                        model=self.embedding_model,
+                        input=contents[offset:offset + _EMBEDDING_BATCH_LIMIT]
+                    )
+                    embeddings.extend(_unit(item.embedding) for item in response.data)
+            rows = self._append_rows(contents, metadatas or [None] * len(contents), embeddings)
             
-            summary = response.choices[0].message.content
-            memory_entry["summary"] = summary
+            # Summarize the batch in _SUMMARY_BATCH_SIZE chunks, requested concurrently
+            await self._add_summaries(rows, contents)
             
-            return f"Stored in OpenAI Memory: {content[:50]}... (Summary: {summary[:30]}...)"
+            return [_stored_message(content, self._summary(row)) for content, row in zip(contents, rows)]
         except Exception as e:
             raise Exception(f"OpenAI store failed: {e}")
     
     async def retrieve_memory(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Retrieve memory using OpenAI."""
         try:
-            if not self.stored_memories:
+            if not self._contents:
                 return f"No memories stored yet for query: '{query}'"
             
-            # Use OpenAI to find the most relevant memories
-            memory_context = "\n".join([
-                f"Memory {i+1}: {mem['content']}" 
-                for i, mem in enumerate(self.stored_memories[-10:])  # Last 10 memories
-            ])
-            
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": f"Based on these stored memories, answer the query. Memories:\n{memory_context}"},
-                    {"role": "user", "content": query}
-                ],
-                max_tokens=200,
-                temperature=0.2
-            )
+            if self._query_cache is not None:
+                key = query_key(query)
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    return cached
             
-            answer = response.choices[0].message.content
+            if not self._vector_search:
+                answer = await self._llm_answer(query, self._contents[-10:])  # Last 10 memories
+                retrieved = f"Retrieved from OpenAI Memory for '{query}': {answer}"
+            elif self._rerank:
+                retrieved = f"Retrieved from OpenAI Memory for '{query}': {await self._vector_answer(query)}"
+            else:
+                retrieved = await self._vector_answer(query)  # format_memories JSON
             
-            return f"Retrieved from OpenAI Memory for '{query}': {answer}"
+            if self._query_cache is not None:
+                self._query_cache.set(key, retrieved)
+            return retrieved
         except Exception as e:
             raise Exception(f"OpenAI retrieve failed: {e}")
     
@@ -102,19 +372,14 @@ class OpenAIMemoryTool(MemoryTool):
         """Chat with OpenAI memory context."""
         try:
             # Build context from stored memories and conversation history
-            context_messages = [
-                {"role": "system", "content": "You are a helpful assistant with access to stored memories. Use the memories to provide contextual responses."}
-            ]
+            context_messages = [_CHAT_SYSTEM_MESSAGE]
             
             # Add memory context
-            if self.stored_memories:
-                memory_context = "Your memories: " + " | ".join([
-                    mem['content'][:100] for mem in self.stored_memories[-5:]  # Last 5 memories
-                ])
-                context_messages.append({"role": "system", "content": memory_context})
+            if self._memory_context_message is not None:
+                context_messages.append(self._memory_context_message)
             
             # Add recent conversation history
-            context_messages.extend(self.conversation_history[-6:])  # Last 3 exchanges
+            context_messages.extend(self.conversation_history)  # Last 3 exchanges
             
             # Add current message
             context_messages.append({"role": "user", "content": message})
@@ -0,0 +1,72 @@
+"""
+Query Cache
+
+Small thread-safe LRU cache with per-entry TTL, used by memory tools to skip
+repeated remote lookups for queries they have already answered.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def query_key(*parts: Any) -> bytes:
+    """Compact digest of a query and whatever else scopes its answer (user, limit, ...)."""
+    return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).digest()
+
+
+class QueryCache:
+    """LRU cache whose entries also expire ``ttl_seconds`` after they were stored."""
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: bytes, value: Any):
+        """Store ``value`` under ``key``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Drop every entry, e.g. after a store that could change query answers."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
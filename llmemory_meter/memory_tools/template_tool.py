@@ -18,6 +18,9 @@ class TemplateTool(MemoryTool):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("template", config)  # Replace "template" with your tool name
         
+        # Simulated base latency in seconds (0 = none); retrieve and chat take 2x and 3x of it
+        self._mock_latency = self.config.get("mock_latency_s", 0.0)
+        
         # Replace with your API key check
         self.api_key = Config.TEMPLATE_API_KEY  # Add to config.py
         if not self.api_key:
@@ -35,6 +38,8 @@ class TemplateTool(MemoryTool):
             # Replace with your client initialization
             # import your_memory_tool
             # self.client = your_memory_tool.Client(api_key=self.api_key)
+            # Build it here, outside measured steps, like Mem0Tool does; a client bound to the event
+            # loop can instead be created on first use and released in aclose, like OpenAIMemoryTool.client
             print("✅ Template client initialized")
         except ImportError:
             print("⚠️  template package not installed - using mock implementation")
@@ -43,10 +48,15 @@ class TemplateTool(MemoryTool):
             print(f"⚠️  Failed to initialize Template: {e} - using mock implementation")
             self._use_mock = True
     
+    async def _simulate_latency(self, multiplier: float):
+        """Sleep for the configured mock latency, scaled per action; a no-op by default."""
+        if self._mock_latency:
+            await asyncio.sleep(self._mock_latency * multiplier)
+    
     async def store_memory(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Store memory in your tool."""
         if self._use_mock:
-            await asyncio.sleep(0.1)  # Simulate API latency
+            await self._simulate_latency(1)  # Simulate API latency
             return f"[MOCK] Stored in Template: {content[:50]}..."
         
         try:
@@ -55,7 +65,7 @@ class TemplateTool(MemoryTool):
             # return f"Stored in Template (ID: {result.id}): {content[:50]}..."
             
             # Placeholder for real implementation
-            await asyncio.sleep(0.1)
+            await self._simulate_latency(1)
             return f"Stored in Template: {content[:50]}..."
             
         except Exception as e:
@@ -64,20 +74,17 @@ class TemplateTool(MemoryTool):
     async def retrieve_memory(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Retrieve memory from your tool."""
         if self._use_mock:
-            await asyncio.sleep(0.2)  # Simulate API latency
+            await self._simulate_latency(2)  # Simulate API latency
             return f"[MOCK] Retrieved from Template for query '{query}': [mock response]"
         
         try:
             # Replace with your actual retrieval logic
             # results = await self.client.search(query, limit=3)
-            # if results:
-            #     formatted_results = [f"{r.content} (score: {r.score})" for r in results]
-            #     return f"Retrieved from Template for '{query}': " + " | ".join(formatted_results)
-            # else:
-            #     return f"No memories found in Template for query: '{query}'"
+            # return format_memories(query, [(r.content, r.score) for r in results])
+            # (format_memories comes from llmemory_meter.memory_tools.base)
             
             # Placeholder for real implementation
-            await asyncio.sleep(0.2)
+            await self._simulate_latency(2)
             return f"Retrieved from Template for '{query}': [placeholder response]"
             
         except Exception as e:
@@ -86,7 +93,7 @@ class TemplateTool(MemoryTool):
     async def chat(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Chat with your tool using memory context."""
         if self._use_mock:
-            await asyncio.sleep(0.3)  # Simulate API latency
+            await self._simulate_latency(3)  # Simulate API latency
             return f"[MOCK] Template response to '{message}': [mock response with memory context]"
         
         try:
@@ -95,7 +102,7 @@ class TemplateTool(MemoryTool):
             # return f"Template response: {response.text}"
             
             # Placeholder for real implementation
-            await asyncio.sleep(0.3)
+            await self._simulate_latency(3)
             return f"Template response to '{message}': [placeholder response with memory context]"
             
         except Exception as e:
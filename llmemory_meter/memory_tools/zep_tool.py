@@ -5,21 +5,29 @@ Implements the MemoryTool interface for Zep memory system.
 Provides long-term memory capabilities for AI assistants.
 """
 
-import os
+import importlib.util
 from typing import Dict, Any, Optional, List
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 
-try:
-    from zep_cloud import Zep, Message, RoleType
-    ZEP_AVAILABLE = True
-except ImportError:
-    ZEP_AVAILABLE = False
-    Zep = None
-    Message = None
-    RoleType = None
+# Checked without importing; the SDK itself is only imported once a ZepTool is built
+ZEP_AVAILABLE = importlib.util.find_spec("zep_cloud") is not None
 
 from llmemory_meter.memory_tools.base import MemoryTool
+from llmemory_meter.config_parser import Config
+
+# Keep-alive pool shared by every request the tool's client makes
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# The SDK's own client times out after 60 s; a caller-supplied client gets no timeout unless
+# one is passed, so it is set explicitly on both (override with the tool's "timeout" option)
+_REQUEST_TIMEOUT_S = 60.0
+
+# Metadata for messages stored without any; one shared dict, never mutated here
+_EMPTY_METADATA: Dict[str, Any] = {}
 
 
 class ZepTool(MemoryTool):
@@ -34,24 +42,55 @@ class ZepTool(MemoryTool):
             )
 
         # Get configuration
-        self.api_key = config.get("api_key") or os.getenv("ZEP_API_KEY")
+        self.api_key = self.config.get("api_key") or Config.ZEP_API_KEY
 
         if not self.api_key:
             raise ValueError("ZEP_API_KEY is required in config or environment variables")
 
-        # Initialize client
-        self.client = Zep(
-            api_key=self.api_key
+        self._initialize_client()
+
+        # The SDK is blocking, so its calls run on this tool's own pool rather than the
+        # loop's shared default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.get("max_workers", 16),
+            thread_name_prefix="zep"
         )
 
         # Session management
-        self.user_id = config.get("user_id", "llmemory_test_user")
-        self.session_id = config.get("session_id", self._session_id)
+        self.user_id = self.config.get("user_id", "llmemory_test_user")
+        self.session_id = self.config.get("session_id", self._session_id)
 
         # Initialize user and session
         self._ensure_user_exists()
         print("✅ Zep client initialized")
 
+    def _initialize_client(self):
+        """Initialize the Zep client on a pooled HTTP client, so requests reuse connections."""
+        import httpx
+        from zep_cloud import Zep, Message, RoleType
+
+        self._message_cls = Message
+        self._user_role = RoleType.USER
+        self._assistant_role = RoleType.ASSISTANT
+
+        timeout = self.config.get("timeout", _REQUEST_TIMEOUT_S)
+        # HTTP/2 multiplexes concurrent requests over one connection when h2 is installed;
+        # timeout and redirects match the client the SDK would otherwise build itself
+        self._http = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=timeout,
+            follow_redirects=True
+        )
+        self.client = Zep(
+            api_key=self.api_key,
+            timeout=timeout,
+            httpx_client=self._http
+        )
+
     def _ensure_user_exists(self):
         """Ensure user exists in Zep."""
         try:
@@ -70,23 +109,32 @@ class ZepTool(MemoryTool):
             # For mock/testing purposes, continue without user creation
             pass
 
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking SDK call on the tool's thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    async def aclose(self):
+        """Shut down the tool's thread pool and close its pooled HTTP connections."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self._http.close()
+
     async def store_memory(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Store information in Zep memory."""
         try:
             # Create message for storage
-            message = Message(
-                role_type=RoleType.USER,
+            message = self._message_cls(
+                role_type=self._user_role,
                 content=content,
-                metadata=metadata or {}
+                metadata=metadata if metadata is not None else _EMPTY_METADATA
             )
 
             # Add message to thread
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.thread.add_messages(
-                    thread_id=self.session_id,
-                    messages=[message]
-                )
+            await self._call(
+                self.client.thread.add_messages,
+                thread_id=self.session_id,
+                messages=[message]
             )
 
             return f"Successfully stored memory: {content[:50]}..."
@@ -99,13 +147,11 @@ class ZepTool(MemoryTool):
         """Retrieve information from Zep memory."""
         try:
             # Get thread context which includes relevant memories
-            context_response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.thread.get_context(
-                    thread_id=self.session_id,
-                    query=query,
-                    limit=5
-                )
+            context_response = await self._call(
+                self.client.thread.get_context,
+                thread_id=self.session_id,
+                query=query,
+                limit=5
             )
 
             if context_response and hasattr(context_response, 'context') and context_response.context:
@@ -130,38 +176,28 @@ class ZepTool(MemoryTool):
             context = await self.retrieve_memory(message, metadata)
 
             # Create user message
-            user_message = Message(
-                role_type=RoleType.USER,
+            user_message = self._message_cls(
+                role_type=self._user_role,
                 content=message,
-                metadata=metadata or {}
-            )
-
-            # Add message to thread
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.thread.add_messages(
-                    thread_id=self.session_id,
-                    messages=[user_message]
-                )
+                metadata=metadata if metadata is not None else _EMPTY_METADATA
             )
 
             # For this implementation, we'll return context-aware response
             # In a real implementation, you'd integrate with an LLM here
             response = f"Based on context: {context}. Responding to: {message}"
 
-            # Store assistant response
-            assistant_message = Message(
-                role_type=RoleType.ASSISTANT,
+            # Create assistant response
+            assistant_message = self._message_cls(
+                role_type=self._assistant_role,
                 content=response,
-                metadata=metadata or {}
+                metadata=metadata if metadata is not None else _EMPTY_METADATA
             )
 
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.thread.add_messages(
-                    thread_id=self.session_id,
-                    messages=[assistant_message]
-                )
+            # Add both messages to the thread in one request
+            await self._call(
+                self.client.thread.add_messages,
+                thread_id=self.session_id,
+                messages=[user_message, assistant_message]
             )
 
             return response
@@ -174,10 +210,7 @@ class ZepTool(MemoryTool):
         """Clear memory for a session."""
         target_session = session_id or self.session_id
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.thread.delete(target_session)
-            )
+            await self._call(self.client.thread.delete, target_session)
             return f"Cleared memory for session: {target_session}"
         except Exception as e:
             return f"Mock: Cleared Zep memory for session {target_session}"
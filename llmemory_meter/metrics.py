@@ -1,12 +1,35 @@
 """Performance metrics calculation and analysis."""
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
-import statistics
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+import heapq
+import math
+from itertools import chain
 from llmemory_meter.workload import WorkloadResult
 
 
-@dataclass
+def _percentiles(values: List[float], quantiles: List[float]) -> List[float]:
+    """Nearest-rank percentiles, selecting only the top of the distribution instead of sorting it all."""
+    n = len(values)
+    indexes = [min(int(q * n), n - 1) for q in quantiles]
+    top = heapq.nlargest(n - min(indexes), values)
+    return [top[n - 1 - i] for i in indexes]
+
+
+def _latency_summary(latencies: List[float]) -> Tuple[float, float, float]:
+    """Reduce a latency column to (mean, p95, p99) in one call."""
+    if not latencies:
+        raise ValueError("No step latencies to summarize")
+    p95, p99 = _percentiles(latencies, [0.95, 0.99])
+    return math.fsum(latencies) / len(latencies), p95, p99
+
+
+def _argsort(values: List[float], reverse: bool = False) -> List[int]:
+    """Indexes that would sort ``values``; stable, so ties keep input order."""
+    return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for a memory tool."""
     tool_name: str
@@ -17,19 +40,24 @@ class PerformanceMetrics:
     avg_tokens_per_query: float
     success_rate: float
     total_queries: int
+    total_retries: int = 0  # transient failures retried; their time is included in the latencies
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to dictionary."""
-        return {
-            "tool_name": self.tool_name,
-            "avg_latency_ms": round(self.avg_latency_ms, 2),
-            "p95_latency_ms": round(self.p95_latency_ms, 2),
-            "p99_latency_ms": round(self.p99_latency_ms, 2),
-            "total_tokens": self.total_tokens,
-            "avg_tokens_per_query": round(self.avg_tokens_per_query, 2),
-            "success_rate": round(self.success_rate * 100, 1),  # Convert to percentage
-            "total_queries": self.total_queries
-        }
+        """Convert metrics to dictionary (built once, copied per call)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "tool_name": self.tool_name,
+                "avg_latency_ms": round(self.avg_latency_ms, 2),
+                "p95_latency_ms": round(self.p95_latency_ms, 2),
+                "p99_latency_ms": round(self.p99_latency_ms, 2),
+                "total_tokens": self.total_tokens,
+                "avg_tokens_per_query": round(self.avg_tokens_per_query, 2),
+                "success_rate": round(self.success_rate * 100, 1),  # Convert to percentage
+                "total_queries": self.total_queries,
+                "total_retries": self.total_retries
+            }
+        return dict(self._dict_cache)
 
 
 class MetricsCalculator:
@@ -41,106 +69,111 @@ class MetricsCalculator:
         if not results:
             raise ValueError("No results provided")
         
-        tool_name = results[0].tool_name
-        all_latencies = []
-        all_tokens = []
-        successful_queries = 0
-        total_queries = 0
-        
-        for result in results:
-            for step_result in result.step_results:
-                all_latencies.append(step_result.latency_ms)
-                if step_result.tokens_used:
-                    all_tokens.append(step_result.tokens_used)
-                if step_result.success:
-                    successful_queries += 1
-                total_queries += 1
-        
-        # Calculate percentiles
-        sorted_latencies = sorted(all_latencies)
-        p95_index = int(0.95 * len(sorted_latencies))
-        p99_index = int(0.99 * len(sorted_latencies))
+        return MetricsCalculator.calculate_metrics_from_columns(
+            results[0].tool_name,
+            list(chain.from_iterable(result.latencies_ms for result in results)),
+            list(chain.from_iterable(result.token_counts for result in results)),
+            sum(result.n_success for result in results),
+            sum(result.n_steps for result in results),
+            sum(result.n_retries for result in results)
+        )
+    
+    @staticmethod
+    def calculate_metrics_from_columns(tool_name: str, latencies: List[float], token_counts: List[int],
+                                       successful_queries: int, total_queries: int,
+                                       total_retries: int = 0) -> PerformanceMetrics:
+        """Calculate metrics from flat per-step columns rather than result objects."""
+        avg_latency, p95_latency, p99_latency = _latency_summary(latencies)
+        total_tokens = sum(token_counts)
         
         return PerformanceMetrics(
             tool_name=tool_name,
-            avg_latency_ms=statistics.mean(all_latencies),
-            p95_latency_ms=sorted_latencies[min(p95_index, len(sorted_latencies) - 1)],
-            p99_latency_ms=sorted_latencies[min(p99_index, len(sorted_latencies) - 1)],
-            total_tokens=sum(all_tokens),
-            avg_tokens_per_query=statistics.mean(all_tokens) if all_tokens else 0,
+            avg_latency_ms=avg_latency,
+            p95_latency_ms=p95_latency,
+            p99_latency_ms=p99_latency,
+            total_tokens=total_tokens,
+            avg_tokens_per_query=total_tokens / len(token_counts) if token_counts else 0,
             success_rate=successful_queries / total_queries if total_queries > 0 else 0,
-            total_queries=total_queries
+            total_queries=total_queries,
+            total_retries=total_retries
         )
     
+    @staticmethod
+    def calculate_metrics_batch(
+        columns_by_tool: Dict[str, Tuple[List[float], List[int], int, int, int]]
+    ) -> Dict[str, PerformanceMetrics]:
+        """Calculate metrics for several tools at once from their flat columns.
+        
+        Each value is ``(latencies, token_counts, successful_queries, total_queries, total_retries)``.
+        Tools without any step latencies are left out of the result.
+        """
+        return {
+            tool_name: MetricsCalculator.calculate_metrics_from_columns(tool_name, *columns)
+            for tool_name, columns in columns_by_tool.items()
+            if columns[0]
+        }
+    
     @staticmethod
     def compare_metrics(metrics_list: List[PerformanceMetrics]) -> Dict[str, Any]:
         """Compare metrics across different tools."""
         if not metrics_list:
             return {}
         
+        # One pass over the metrics builds every column; the comparisons and rankings share them
+        names, latencies, tokens, success_rates = map(list, zip(*(
+            (m.tool_name, m.avg_latency_ms, m.avg_tokens_per_query, m.success_rate)
+            for m in metrics_list
+        )))
+        rankings = MetricsCalculator._calculate_rankings(names, latencies, tokens, success_rates)
+        
         comparison = {
-            "tools": [m.tool_name for m in metrics_list],
+            "tools": names,
             "latency_comparison": {},
             "token_comparison": {},
             "success_rate_comparison": {},
-            "rankings": {}
+            "rankings": rankings
         }
         
         # Latency comparison
-        latencies = {m.tool_name: m.avg_latency_ms for m in metrics_list}
-        best_latency = min(latencies.values())
+        best_latency = min(latencies)
         comparison["latency_comparison"] = {
-            "values": latencies,
-            "best": min(latencies, key=latencies.get),
+            "values": dict(zip(names, latencies)),
+            "best": rankings["latency"][0],
             "relative_performance": {
                 name: f"{((lat / best_latency - 1) * 100):+.1f}%" 
-                for name, lat in latencies.items()
+                for name, lat in zip(names, latencies)
             }
         }
         
         # Token comparison
-        tokens = {m.tool_name: m.avg_tokens_per_query for m in metrics_list}
-        best_tokens = min([t for t in tokens.values() if t > 0], default=0)
-        if best_tokens > 0:
+        if rankings["token_efficiency"]:
+            best_tokens = min(t for t in tokens if t > 0)
             comparison["token_comparison"] = {
-                "values": tokens,
-                "best": min([k for k, v in tokens.items() if v == best_tokens], default="N/A"),
+                "values": dict(zip(names, tokens)),
+                "best": rankings["token_efficiency"][0],
                 "relative_efficiency": {
                     name: f"{((tok / best_tokens - 1) * 100):+.1f}%" if tok > 0 else "N/A"
-                    for name, tok in tokens.items()
+                    for name, tok in zip(names, tokens)
                 }
             }
         
         # Success rate comparison
-        success_rates = {m.tool_name: m.success_rate * 100 for m in metrics_list}
         comparison["success_rate_comparison"] = {
-            "values": success_rates,
-            "best": max(success_rates, key=success_rates.get)
+            "values": {name: rate * 100 for name, rate in zip(names, success_rates)},
+            "best": rankings["success_rate"][0]
         }
         
-        # Overall rankings
-        comparison["rankings"] = MetricsCalculator._calculate_rankings(metrics_list)
-        
         return comparison
     
     @staticmethod
-    def _calculate_rankings(metrics_list: List[PerformanceMetrics]) -> Dict[str, List[str]]:
-        """Calculate rankings for different metrics."""
-        rankings = {}
-        
-        # Latency ranking (lower is better)
-        latency_sorted = sorted(metrics_list, key=lambda m: m.avg_latency_ms)
-        rankings["latency"] = [m.tool_name for m in latency_sorted]
-        
-        # Token efficiency ranking (lower is better, excluding 0)
-        token_sorted = sorted(
-            [m for m in metrics_list if m.avg_tokens_per_query > 0], 
-            key=lambda m: m.avg_tokens_per_query
-        )
-        rankings["token_efficiency"] = [m.tool_name for m in token_sorted]
-        
-        # Success rate ranking (higher is better)
-        success_sorted = sorted(metrics_list, key=lambda m: m.success_rate, reverse=True)
-        rankings["success_rate"] = [m.tool_name for m in success_sorted]
-        
-        return rankings
+    def _calculate_rankings(names: List[str], latencies: List[float], tokens: List[float],
+                            success_rates: List[float]) -> Dict[str, List[str]]:
+        """Rank tool names by each metric column (ties keep input order)."""
+        return {
+            # Lower is better
+            "latency": [names[i] for i in _argsort(latencies)],
+            # Lower is better, excluding tools that reported no tokens
+            "token_efficiency": [names[i] for i in _argsort(tokens) if tokens[i] > 0],
+            # Higher is better
+            "success_rate": [names[i] for i in _argsort(success_rates, reverse=True)]
+        }
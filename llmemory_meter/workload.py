@@ -1,26 +1,44 @@
 """Workload definition and result classes for memory tool testing."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import hashlib
+import heapq
+import sys
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkloadStep:
-    """A single step in a workload test."""
+    """A single step in a workload test (immutable, shared across tools)."""
     action: str  # "store", "retrieve", "chat"
     content: str
     expected_response: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    # Digest of the content, computed once here instead of per tool when results are cached
+    content_key: bytes = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "content_key", hashlib.blake2b(self.content.encode(), digest_size=16).digest())
+        # Suites build many steps with the same action and metadata values; share one copy of each string
+        object.__setattr__(self, "action", sys.intern(self.action))
+        if self.metadata:
+            object.__setattr__(self, "metadata", {
+                sys.intern(k) if isinstance(k, str) else k: sys.intern(v) if isinstance(v, str) else v
+                for k, v in self.metadata.items()
+            })
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Workload:
-    """A complete workload for testing memory tools."""
+    """A complete workload for testing memory tools (immutable, shared across tools)."""
     name: str
     description: str
     steps: List[WorkloadStep]
     expected_outcomes: Optional[Dict[str, Any]] = None
+    # Steps in a run of consecutive stores or retrieves don't depend on each other and may run
+    # concurrently; chat steps and the boundaries between runs always keep their order
+    dependency_parallel: bool = False
     
     @classmethod
     def create_simple_workload(cls, name: str, memory_content: str, retrieval_query: str):
@@ -44,6 +62,24 @@ class Workload:
             steps=steps
         )
     
+    @classmethod
+    def from_columns(cls, name: str, description: str, actions: List[str], contents: List[str],
+                     metadatas: Optional[List[Optional[Dict[str, Any]]]] = None):
+        """Create a workload from parallel lists of actions, contents and metadata."""
+        if metadatas is None:
+            metadatas = [None] * len(actions)
+        if not len(actions) == len(contents) == len(metadatas):
+            raise ValueError("actions, contents and metadatas must have the same length")
+        
+        return cls(
+            name=name,
+            description=description,
+            steps=[
+                WorkloadStep(action=action, content=content, metadata=metadata)
+                for action, content, metadata in zip(actions, contents, metadatas)
+            ]
+        )
+    
     @classmethod
     def create_conversation_workload(cls, name: str, conversation_steps: List[str]):
         """Create a multi-turn conversation workload."""
@@ -62,7 +98,7 @@ class Workload:
         )
 
 
-@dataclass 
+@dataclass(slots=True)
 class StepResult:
     """Result of executing a single workload step."""
     step_index: int
@@ -73,9 +109,10 @@ class StepResult:
     success: bool = True
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    retries_used: int = 0  # transient failures retried before this outcome
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkloadResult:
     """Complete result of running a workload on a memory tool."""
     tool_name: str
@@ -85,33 +122,70 @@ class WorkloadResult:
     total_tokens_used: int
     success_rate: float
     timestamp: datetime
+    # Per-step columns extracted once so aggregations don't walk StepResult objects
+    latencies_ms: List[float] = field(init=False, repr=False)
+    successes: List[bool] = field(init=False, repr=False)
+    token_counts: List[int] = field(init=False, repr=False)  # only steps that reported tokens
+    errors: Dict[int, str] = field(init=False, repr=False)
+    n_steps: int = field(init=False, repr=False)
+    n_success: int = field(init=False, repr=False)
+    n_failed: int = field(init=False, repr=False)
+    n_retries: int = field(init=False, repr=False)  # transient failures retried across all steps
+    # Latency summaries, computed once from the latency column
+    _avg_latency_ms: float = field(init=False, repr=False, compare=False)
+    _p95_latency_ms: float = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.latencies_ms = [r.latency_ms for r in self.step_results]
+        self.successes = [r.success for r in self.step_results]
+        self.token_counts = [r.tokens_used for r in self.step_results if r.tokens_used]
+        self.n_steps = len(self.successes)
+        self.n_success = sum(self.successes)
+        self.n_failed = self.n_steps - self.n_success
+        self.n_retries = sum(r.retries_used for r in self.step_results)
+        self.errors = {
+            r.step_index: r.error_message
+            for r in self.step_results
+            if not r.success and r.error_message
+        }
+        n = len(self.latencies_ms)
+        if n:
+            self._avg_latency_ms = sum(self.latencies_ms) / n
+            # Nearest-rank p95 is the (n - index)-th largest; only the top 5% gets ordered
+            index = min(int(0.95 * n), n - 1)
+            self._p95_latency_ms = heapq.nlargest(n - index, self.latencies_ms)[-1]
+        else:
+            self._avg_latency_ms = self._p95_latency_ms = 0.0
+    
+    @property
+    def failed_indices(self) -> List[int]:
+        """Step indices of the steps that failed (messages are in ``errors``)."""
+        return [i for i, ok in enumerate(self.successes) if not ok]
     
     @property
     def avg_latency_ms(self) -> float:
-        """Calculate average latency per step."""
-        if not self.step_results:
-            return 0.0
-        return sum(r.latency_ms for r in self.step_results) / len(self.step_results)
+        """Average latency per step."""
+        return self._avg_latency_ms
     
     @property
     def p95_latency_ms(self) -> float:
-        """Calculate 95th percentile latency."""
-        if not self.step_results:
-            return 0.0
-        latencies = sorted([r.latency_ms for r in self.step_results])
-        index = int(0.95 * len(latencies))
-        return latencies[min(index, len(latencies) - 1)]
+        """95th percentile latency."""
+        return self._p95_latency_ms
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary for easy serialization."""
-        return {
-            "tool_name": self.tool_name,
-            "workload_name": self.workload_name,
-            "total_latency_ms": self.total_latency_ms,
-            "avg_latency_ms": self.avg_latency_ms,
-            "p95_latency_ms": self.p95_latency_ms,
-            "total_tokens_used": self.total_tokens_used,
-            "success_rate": self.success_rate,
-            "num_steps": len(self.step_results),
-            "timestamp": self.timestamp.isoformat()
-        }
+        """Convert result to dictionary for easy serialization (built once, copied per call)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "tool_name": self.tool_name,
+                "workload_name": self.workload_name,
+                "total_latency_ms": self.total_latency_ms,
+                "avg_latency_ms": self.avg_latency_ms,
+                "p95_latency_ms": self.p95_latency_ms,
+                "total_tokens_used": self.total_tokens_used,
+                "success_rate": self.success_rate,
+                "num_steps": self.n_steps,
+                "total_retries": self.n_retries,
+                "timestamp": self.timestamp.isoformat()
+            }
+        return dict(self._dict_cache)
@@ -12,7 +12,7 @@ Usage:
 """
 
 import asyncio
-from llmemory_meter import MemoryComparator
+from llmemory_meter import MemoryComparator, install_fast_loop, log_progress_to_stdout
 
 
 async def main():
@@ -74,4 +74,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
+    log_progress_to_stdout()
     asyncio.run(main())